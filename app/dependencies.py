@@ -1,6 +1,11 @@
+import asyncio
+import hashlib
 import os
+import time
 from typing import Annotated
 
+from cachetools import TTLCache
+
 from fastapi import Depends, HTTPException
 from fastapi.security import OAuth2PasswordBearer
 import jwt
@@ -22,6 +27,11 @@ async def get_engine(request: HTTPConnection) -> Engine:
 ActiveEngine = Annotated[Engine, Depends(get_engine)]
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/token")
 
+# Decoded token claims (email, exp) keyed by a hash of the bearer token (raw tokens are never
+# stored), so repeat requests skip the JWT decode. The user itself is still loaded on every
+# request, so status, role and preference changes apply immediately.
+_token_cache: TTLCache = TTLCache(maxsize=10_000, ttl=30)
+
 
 async def get_current_user(engine: ActiveEngine, token: Annotated[EmailStr, Depends(oauth2_scheme)]) -> User:
     credentials_exception = HTTPException(
@@ -29,22 +39,28 @@ async def get_current_user(engine: ActiveEngine, token: Annotated[EmailStr, Depe
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
-    try:
-        payload = jwt.decode(
-            token,
-            os.environ["SECRET_KEY"],
-            algorithms=[os.environ["ALGORITHM"]],
-        )
+    cache_key = hashlib.sha256(token.encode()).digest()[:16]
+    cached = _token_cache.get(cache_key)
+    if cached is not None and (cached[1] is None or cached[1] > time.time()):
+        username = cached[0]
+    else:
+        try:
+            payload = jwt.decode(
+                token,
+                os.environ["SECRET_KEY"],
+                algorithms=[os.environ["ALGORITHM"]],
+            )
+        except InvalidTokenError:
+            raise credentials_exception
         username = payload.get("sub")
         if username is None:
             raise credentials_exception
-        token = TokenData(username=username)
-        user = get_user_by_email(engine, token.username)
-        if user is None:
-            raise credentials_exception
-        return user
-    except InvalidTokenError:
+        _token_cache[cache_key] = (username, payload.get("exp"))
+    token_data = TokenData(username=username)
+    user = await asyncio.to_thread(get_user_by_email, engine, token_data.username)
+    if user is None:
         raise credentials_exception
+    return user
 
 async def get_current_active_user(current_user: Annotated[User, Depends(get_current_user)]) -> User:
     if current_user.status != UserStatus.ACTIVE:
@@ -1,3 +1,4 @@
+import asyncio
 import os
 from datetime import datetime, timedelta, timezone
 from fastapi import HTTPException
@@ -5,11 +6,23 @@ from google.auth.transport import requests
 from google.oauth2 import id_token
 from jose import jwt
 from sqlalchemy import Engine
+from sqlmodel import Session
 from starlette import status
 
-from app.logic.users import get_user_by_email
+from app.logic.users import create_user_from_google, get_user_by_email, select_user_by_email_or_google_id
 from app.models.token import TokenRequest
-from app.models.users import User
+from app.models.users import User, UserStatus
+
+# Reused across Google token verifications so the certs fetch keeps its session.
+_GOOGLE_TRANSPORT = requests.Request()
+
+
+def _google_client_id() -> str:
+    """Read GOOGLE_CLIENT_ID per verification, so deployments without Google login still start"""
+    client_id = os.getenv("GOOGLE_CLIENT_ID")
+    if not client_id:
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Google login is not configured")
+    return client_id
 
 
 def create_access_token(data: dict, expires_delta: timedelta | None = None):
@@ -31,8 +44,8 @@ def get_google_current_user(engine: Engine, google_token: TokenRequest)-> User:
     )
     id_info = id_token.verify_oauth2_token(
         google_token.token,
-        requests.Request(),
-        os.environ["GOOGLE_CLIENT_ID"],
+        _GOOGLE_TRANSPORT,
+        _google_client_id(),
     )
     email = id_info["email"]
     if email is None:
@@ -41,3 +54,44 @@ def get_google_current_user(engine: Engine, google_token: TokenRequest)-> User:
     if user is None:
         raise credentials_exception
     return user
+
+
+async def handle_google_login(engine: Engine, token: str) -> User:
+    """Login or signup with a Google ID token and return the active user"""
+    # Verification fetches Google's certs over blocking HTTP, keep it off the event loop
+    id_info = await asyncio.to_thread(
+        id_token.verify_oauth2_token,
+        token,
+        _GOOGLE_TRANSPORT,
+        _google_client_id(),
+    )
+
+    return await asyncio.to_thread(
+        _login_or_create_google_user,
+        engine,
+        id_info["email"],
+        id_info.get("name"),
+        id_info["sub"],
+    )
+
+
+def _login_or_create_google_user(engine: Engine, email: str, name: str | None, google_id: str) -> User:
+    """Activate the user matching a verified Google identity, creating it if needed"""
+    with Session(engine, expire_on_commit=False) as session:
+        # Check if user exists by email or google_id
+        user = session.exec(select_user_by_email_or_google_id(email, google_id)).first()
+
+        if user:
+            # Existing user - login flow
+            if user.status == UserStatus.SUSPENDED:
+                raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="User already suspended")
+            # Update google_id if not set
+            if not user.google_id:
+                user.google_id = google_id
+            user.status = UserStatus.ACTIVE
+            session.add(user)
+            session.commit()
+            return user
+
+    # New user - signup flow (created active)
+    return create_user_from_google(engine, email, name, google_id)
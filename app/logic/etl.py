@@ -7,12 +7,16 @@ Note: No Load step - data is returned directly without storage
 """
 
 import httpx
+import orjson
 import os
 import logging
 from typing import Optional
 from datetime import datetime, timedelta, timezone
 
+from app.logic.games import cheapshark_get
+from app.logic.stores import FALLBACK_STORES
 from app.models.games import Game, GamePrice
+from app.services.http_client import get_http_client
 
 # IGDB API configuration (Twitch OAuth) - set IGDB_CLIENT_ID and IGDB_CLIENT_SECRET in .env
 IGDB_CLIENT_ID = os.getenv("IGDB_CLIENT_ID", "")
@@ -57,15 +61,15 @@ async def extract_from_cheapshark(search: Optional[str] = None, page_size: int =
         UpstreamDataError: If API request fails, times out, or returns non-200 status
     """
     try:
-        async with httpx.AsyncClient(timeout=CHEAPSHARK_TIMEOUT) as client:
-            url = f"{CHEAPSHARK_BASE_URL}/deals"
-            params = {"pageSize": page_size}
-            if search:
-                params["title"] = search
-            
-            response = await client.get(url, params=params)
-            response.raise_for_status()
-            return response.json()
+        url = f"{CHEAPSHARK_BASE_URL}/deals"
+        params = {"pageSize": page_size}
+        if search:
+            params["title"] = search
+        
+        # Shares the CheapShark concurrency cap with the games endpoints
+        response = await cheapshark_get(url, params=params, timeout=CHEAPSHARK_TIMEOUT)
+        response.raise_for_status()
+        return orjson.loads(response.content)
     except httpx.TimeoutException:
         raise UpstreamDataError("Upstream CheapShark API timeout")
     except httpx.HTTPStatusError as e:
@@ -98,30 +102,31 @@ async def get_igdb_access_token() -> str:
         return ""
     
     try:
-        async with httpx.AsyncClient(timeout=IGDB_TIMEOUT) as client:
-            response = await client.post(
-                IGDB_OAUTH_URL,
-                params={
-                    "client_id": IGDB_CLIENT_ID,
-                    "client_secret": IGDB_CLIENT_SECRET,
-                    "grant_type": "client_credentials"
-                }
-            )
-            response.raise_for_status()
-            data = response.json()
-            
-            access_token = data.get("access_token")
-            expires_in = data.get("expires_in", 3600)  # Default 1 hour
-            
-            if not access_token:
-                logger.warning("IGDB OAuth response missing access_token")
-                return ""
-            
-            # Cache token
-            _igdb_token = access_token
-            _igdb_token_expires_at = datetime.utcnow() + timedelta(seconds=expires_in)
-            
-            return access_token
+        client = get_http_client()
+        response = await client.post(
+            IGDB_OAUTH_URL,
+            params={
+                "client_id": IGDB_CLIENT_ID,
+                "client_secret": IGDB_CLIENT_SECRET,
+                "grant_type": "client_credentials"
+            },
+            timeout=IGDB_TIMEOUT,
+        )
+        response.raise_for_status()
+        data = orjson.loads(response.content)
+        
+        access_token = data.get("access_token")
+        expires_in = data.get("expires_in", 3600)  # Default 1 hour
+        
+        if not access_token:
+            logger.warning("IGDB OAuth response missing access_token")
+            return ""
+        
+        # Cache token
+        _igdb_token = access_token
+        _igdb_token_expires_at = datetime.utcnow() + timedelta(seconds=expires_in)
+        
+        return access_token
             
     except httpx.TimeoutException:
         logger.warning("IGDB OAuth: Request timeout")
@@ -154,32 +159,33 @@ async def igdb_fetch_genres_catalog() -> dict[int, str]:
         # Build IGDB query (single request, limit 500)
         query = "fields id,name; limit 500;"
         
-        async with httpx.AsyncClient(timeout=IGDB_TIMEOUT) as client:
-            response = await client.post(
-                IGDB_GENRES_URL,
-                headers={
-                    "Client-ID": IGDB_CLIENT_ID,
-                    "Authorization": f"Bearer {token}"
-                },
-                content=query.encode("utf-8")
-            )
-            response.raise_for_status()
-            data = response.json()
-            
-            # Build catalog from response
-            catalog: dict[int, str] = {}
-            if isinstance(data, list):
-                for item in data:
-                    if isinstance(item, dict) and "id" in item and "name" in item:
-                        try:
-                            genre_id = int(item["id"])
-                            genre_name = str(item["name"])
-                            if genre_name:
-                                catalog[genre_id] = genre_name
-                        except (ValueError, TypeError):
-                            continue
-            
-            return catalog
+        client = get_http_client()
+        response = await client.post(
+            IGDB_GENRES_URL,
+            headers={
+                "Client-ID": IGDB_CLIENT_ID,
+                "Authorization": f"Bearer {token}"
+            },
+            content=query.encode("utf-8"),
+            timeout=IGDB_TIMEOUT,
+        )
+        response.raise_for_status()
+        data = orjson.loads(response.content)
+        
+        # Build catalog from response
+        catalog: dict[int, str] = {}
+        if isinstance(data, list):
+            for item in data:
+                if isinstance(item, dict) and "id" in item and "name" in item:
+                    try:
+                        genre_id = int(item["id"])
+                        genre_name = str(item["name"])
+                        if genre_name:
+                            catalog[genre_id] = genre_name
+                    except (ValueError, TypeError):
+                        continue
+        
+        return catalog
             
     except (httpx.TimeoutException, httpx.HTTPStatusError, Exception) as e:
         logger.warning(f"IGDB genres catalog fetch error: {type(e).__name__}")
@@ -206,40 +212,41 @@ async def igdb_fetch_games_genre_ids() -> list[list[int]]:
         # Build IGDB query (single request, only genres field, always 500)
         query = f"fields genres; sort id asc; limit {IGDB_LIMIT};"
         
-        async with httpx.AsyncClient(timeout=IGDB_TIMEOUT) as client:
-            response = await client.post(
-                IGDB_GAMES_URL,
-                headers={
-                    "Client-ID": IGDB_CLIENT_ID,
-                    "Authorization": f"Bearer {token}"
-                },
-                content=query.encode("utf-8")
-            )
-            response.raise_for_status()
-            data = response.json()
-            
-            # Extract genre IDs for each game
-            genre_id_lists: list[list[int]] = []
-            if isinstance(data, list):
-                for game in data:
-                    genres = game.get("genres", [])
-                    
-                    # Ensure genres is a list and filter only integers
-                    if not genres:
-                        genre_id_lists.append([])
-                    else:
-                        genre_ids = []
-                        for g in genres:
-                            if isinstance(g, int):
-                                genre_ids.append(g)
-                            elif isinstance(g, (str, float)):
-                                try:
-                                    genre_ids.append(int(g))
-                                except (ValueError, TypeError):
-                                    continue
-                        genre_id_lists.append(genre_ids)
-            
-            return genre_id_lists
+        client = get_http_client()
+        response = await client.post(
+            IGDB_GAMES_URL,
+            headers={
+                "Client-ID": IGDB_CLIENT_ID,
+                "Authorization": f"Bearer {token}"
+            },
+            content=query.encode("utf-8"),
+            timeout=IGDB_TIMEOUT,
+        )
+        response.raise_for_status()
+        data = orjson.loads(response.content)
+        
+        # Extract genre IDs for each game
+        genre_id_lists: list[list[int]] = []
+        if isinstance(data, list):
+            for game in data:
+                genres = game.get("genres", [])
+                
+                # Ensure genres is a list and filter only integers
+                if not genres:
+                    genre_id_lists.append([])
+                else:
+                    genre_ids = []
+                    for g in genres:
+                        if isinstance(g, int):
+                            genre_ids.append(g)
+                        elif isinstance(g, (str, float)):
+                            try:
+                                genre_ids.append(int(g))
+                            except (ValueError, TypeError):
+                                continue
+                    genre_id_lists.append(genre_ids)
+        
+        return genre_id_lists
             
     except (httpx.TimeoutException, httpx.HTTPStatusError, Exception) as e:
         logger.warning(f"IGDB games genre IDs fetch error: {type(e).__name__}")
@@ -405,64 +412,65 @@ async def igdb_fetch_games_full(limit: int = IGDB_LIMIT) -> list[dict]:
         # Build IGDB query - include cover.url for images
         query = f"fields name,rating,first_release_date,genres,cover.url; sort id asc; limit {limit};"
         
-        async with httpx.AsyncClient(timeout=IGDB_TIMEOUT) as client:
-            response = await client.post(
-                IGDB_GAMES_URL,
-                headers={
-                    "Client-ID": IGDB_CLIENT_ID,
-                    "Authorization": f"Bearer {token}"
-                },
-                content=query.encode("utf-8")
-            )
-            response.raise_for_status()
-            data = response.json()
-            
-            # Transform games
-            games: list[dict] = []
-            if isinstance(data, list):
-                for game in data:
-                    # Extract and convert genres IDs to names
-                    genre_ids = game.get("genres", []) or []
-                    genre_names: list[str] = []
-                    
-                    for gid in genre_ids:
-                        try:
-                            genre_id = int(gid) if isinstance(gid, (int, str)) else None
-                            if genre_id and genre_id in catalog:
-                                genre_name = catalog[genre_id]
-                                if genre_name:
-                                    genre_names.append(genre_name)
-                        except (ValueError, TypeError):
-                            continue
-                    
-                    # If no genres found, use "Unknown"
-                    if not genre_names:
-                        genre_names = ["Unknown"]
-                    
-                    # Extract rating (can be None)
-                    rating = game.get("rating")
-                    if rating is not None:
-                        try:
-                            rating = float(rating)
-                        except (ValueError, TypeError):
-                            rating = None
-                    
-                    # Extract and convert release date
-                    release_date = _ts_to_iso_date(game.get("first_release_date"))
-                    
-                    # Extract and normalize cover image URL
-                    cover_data = game.get("cover")
-                    image_url = _normalize_igdb_cover_url(cover_data)
-                    
-                    games.append({
-                        "name": game.get("name") or "Unknown",
-                        "rating": rating,
-                        "release_date": release_date,
-                        "genres": genre_names,
-                        "image_url": image_url,
-                    })
-            
-            return games
+        client = get_http_client()
+        response = await client.post(
+            IGDB_GAMES_URL,
+            headers={
+                "Client-ID": IGDB_CLIENT_ID,
+                "Authorization": f"Bearer {token}"
+            },
+            content=query.encode("utf-8"),
+            timeout=IGDB_TIMEOUT,
+        )
+        response.raise_for_status()
+        data = orjson.loads(response.content)
+        
+        # Transform games
+        games: list[dict] = []
+        if isinstance(data, list):
+            for game in data:
+                # Extract and convert genres IDs to names
+                genre_ids = game.get("genres", []) or []
+                genre_names: list[str] = []
+                
+                for gid in genre_ids:
+                    try:
+                        genre_id = int(gid) if isinstance(gid, (int, str)) else None
+                        if genre_id and genre_id in catalog:
+                            genre_name = catalog[genre_id]
+                            if genre_name:
+                                genre_names.append(genre_name)
+                    except (ValueError, TypeError):
+                        continue
+                
+                # If no genres found, use "Unknown"
+                if not genre_names:
+                    genre_names = ["Unknown"]
+                
+                # Extract rating (can be None)
+                rating = game.get("rating")
+                if rating is not None:
+                    try:
+                        rating = float(rating)
+                    except (ValueError, TypeError):
+                        rating = None
+                
+                # Extract and convert release date
+                release_date = _ts_to_iso_date(game.get("first_release_date"))
+                
+                # Extract and normalize cover image URL
+                cover_data = game.get("cover")
+                image_url = _normalize_igdb_cover_url(cover_data)
+                
+                games.append({
+                    "name": game.get("name") or "Unknown",
+                    "rating": rating,
+                    "release_date": release_date,
+                    "genres": genre_names,
+                    "image_url": image_url,
+                })
+        
+        return games
             
     except httpx.TimeoutException:
         logger.warning("IGDB games full fetch: Request timeout")
@@ -546,17 +554,7 @@ def transform_cheapshark_deal(raw_deal: dict, genres: list[str] | None = None) -
 
 def _get_store_name(store_id: str) -> str:
     """Map CheapShark store IDs to names."""
-    stores = {
-        "1": "Steam",
-        "2": "GamersGate",
-        "3": "GreenManGaming",
-        "7": "GOG",
-        "8": "Origin",
-        "11": "Humble Store",
-        "13": "Uplay",
-        "25": "Epic Games",
-    }
-    return stores.get(store_id, f"Store {store_id}")
+    return FALLBACK_STORES.get(store_id, f"Store {store_id}")
 
 
 def _calc_discount_percent(raw_deal: dict) -> float:
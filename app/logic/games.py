@@ -2,11 +2,18 @@ from typing import Optional
 
 import httpx
 import asyncio
+import orjson
+import html
 import re
 import os
 import logging
-from app.models.games import GameResponse
+import time
+from operator import itemgetter
+from cachetools import TTLCache
+from app.models.games import GameResponse, PriceComparison
 from app.logic.stores import fetch_cheapshark_stores
+from app.services.http_client import get_with_retry
+from app.utilities.cache import async_ttl_cache, single_flight
 
 
 def select_all_games_from_dict(games_db: dict) -> list[dict]:
@@ -40,86 +47,173 @@ RAWG_API_KEY = os.getenv("RAWG_API_KEY", "")
 if not RAWG_API_KEY:
     logger.warning("RAWG_API_KEY environment variable not set. RAWG API features will be disabled.")
 
+# Per-host caps on concurrent upstream requests (both APIs throttle bursts) when endpoints
+# fan out with asyncio.gather; with the shared HTTP/2 client these multiplex over few connections.
+_RAWG_SEMAPHORE = asyncio.Semaphore(8)
+_CHEAPSHARK_SEMAPHORE = asyncio.Semaphore(32)
+
+# Placeholder genres used when RAWG enrichment is skipped or returns nothing.
+# Shared across responses; GameResponse objects are never mutated after construction.
+_DEFAULT_GENRES = ["Action"]
+
+# RAWG descriptions arrive as HTML; tags are stripped, then entities decoded
+_HTML_TAG_RE = re.compile(r'<[^>]+>')
+
+# Short-lived upstream caches: the deals feed moves on the order of minutes,
+# RAWG metadata for a title is effectively static.
+_deals_index_cache: TTLCache = TTLCache(maxsize=32, ttl=60)
+# Verified RAWG misses are cached as {} so unknown titles don't cost round trips every request
+_rawg_cache: TTLCache = TTLCache(maxsize=1024, ttl=3600)
+_rawg_inflight: dict[tuple[str, bool], asyncio.Task] = {}
+
 
 # ============== EXTRACT FUNCTIONS ==============
 
-async def fetch_cheapshark_deals(sort_by: Optional[str] = None, page_size: int = 60) -> list[dict]:
-    """Fetch deals from CheapShark API."""
-    async with httpx.AsyncClient() as client:
-        url = "https://www.cheapshark.com/api/1.0/deals"
-        params = {"pageSize": page_size}
-        if sort_by:
-            params["sortBy"] = sort_by
-        response = await client.get(url, params=params, timeout=5.0)
-        response.raise_for_status()
-        return response.json()
+async def cheapshark_get(url: str, params: Optional[dict], timeout: float, headers: Optional[dict[str, str]] = None) -> httpx.Response:
+    """GET a CheapShark endpoint under the per-host concurrency cap, retrying throttling/5xx."""
+    async with _CHEAPSHARK_SEMAPHORE:
+        return await get_with_retry(url, params=params, headers=headers, timeout=timeout)
+
 
+async def fetch_cheapshark_deals(sort_by: Optional[str] = None, page_size: int = 60, page_number: int = 0, timeout: float = 5.0) -> list[dict]:
+    """Fetch deals from CheapShark API (cached for 60 seconds per sort/page size/page; timeout is per call)."""
+    # Positional, so keyword and default spellings of the same page share one cache entry
+    return await _fetch_cheapshark_deals_page(sort_by, page_size, page_number, timeout)
+
+
+@async_ttl_cache(maxsize=32, ttl=60)
+async def _fetch_cheapshark_deals_page(sort_by: Optional[str], page_size: int, page_number: int, timeout: float) -> list[dict]:
+    """Request one deals page and normalize its IDs and prices."""
+    url = "https://www.cheapshark.com/api/1.0/deals"
+    params = {"pageSize": page_size}
+    if sort_by:
+        params["sortBy"] = sort_by
+    if page_number:
+        params["pageNumber"] = page_number
+    response = await cheapshark_get(url, params=params, timeout=timeout)
+    response.raise_for_status()
+    # Normalize IDs and prices once at ingest; cached pages are then read per request
+    # without repeated str()/float() parsing. A deal with an unparseable price is dropped
+    # rather than failing the whole page.
+    deals = []
+    for deal in orjson.loads(response.content):
+        try:
+            sale_price = float(deal.get("salePrice", 0))
+            normal_price = float(deal.get("normalPrice", sale_price))
+        except (ValueError, TypeError):
+            logger.warning(f"Skipping deal {deal.get('dealID')} with invalid prices: {deal.get('salePrice')!r}/{deal.get('normalPrice')!r}")
+            continue
+        deal["gameID"] = str(deal.get("gameID", ""))
+        if deal.get("storeID") is not None:
+            deal["storeID"] = str(deal["storeID"])
+        deal["salePrice"] = sale_price
+        deal["normalPrice"] = normal_price
+        deals.append(deal)
+    return deals
+
+
+async def fetch_cheapshark_deals_by_game_id(page_size: int = 60, page_number: int = 0, timeout: float = 5.0) -> dict[str, list[dict]]:
+    """Fetch a deals page grouped by gameID (feed order kept), reusing the index while the page is cached."""
+    deals = await fetch_cheapshark_deals(page_size=page_size, page_number=page_number, timeout=timeout)
+    key = (page_size, page_number)
+    cached = _deals_index_cache.get(key)
+    if cached is not None and cached[0] is deals:
+        return cached[1]
+    
+    deals_by_game_id: dict[str, list[dict]] = {}
+    for deal in deals:
+        deals_by_game_id.setdefault(deal["gameID"], []).append(deal)
+    _deals_index_cache[key] = (deals, deals_by_game_id)
+    return deals_by_game_id
 
+
+@async_ttl_cache(maxsize=256, ttl=300)
 async def fetch_cheapshark_games_search(query: str) -> list[dict]:
-    """Search games from CheapShark API."""
-    async with httpx.AsyncClient() as client:
+    """Search games from CheapShark API (cached for 5 minutes per query)."""
+    url = "https://www.cheapshark.com/api/1.0/games"
+    params = {"title": query}
+    response = await cheapshark_get(url, params=params, timeout=10.0)
+    response.raise_for_status()
+    return orjson.loads(response.content)
+
+
+@async_ttl_cache(maxsize=1024, ttl=300)
+async def fetch_cheapshark_game_lookup_raw(game_id: str) -> Optional[dict | list]:
+    """Fetch the raw CheapShark game lookup response for a gameID (successful lookups cached for 5 minutes)."""
+    try:
         url = "https://www.cheapshark.com/api/1.0/games"
-        params = {"title": query}
-        response = await client.get(url, params=params, timeout=10.0)
-        response.raise_for_status()
-        return response.json()
+        params = {"id": game_id}
+        response = await cheapshark_get(url, params=params, timeout=5.0)
+        if response.status_code >= 400:
+            logger.warning("HTTP %s looking up game %s", response.status_code, game_id)
+            return None
+        return orjson.loads(response.content)
+    except httpx.HTTPError as e:
+        logger.warning("HTTP error looking up game %s: %s", game_id, e)
+    except orjson.JSONDecodeError as e:
+        logger.warning("Invalid lookup response for game %s: %s", game_id, e)
+    return None
+
+
+def find_cheapest_deal(deals: list[dict]) -> tuple[Optional[dict], float]:
+    """Return the cheapest lookup deal and its price, skipping deals with unparseable prices."""
+    best = None
+    best_price = float("inf")
+    for deal in deals:
+        try:
+            price = float(deal.get("price", "inf"))
+        except (TypeError, ValueError):
+            continue
+        if price < best_price:
+            best_price, best = price, deal
+    return best, best_price
 
 
-async def fetch_cheapshark_game_lookup(game_id: str) -> Optional[dict]:
-    """Lookup game info from CheapShark API by gameID using lookup endpoint."""
+def parse_cheapshark_game_lookup(game_id: str, data: dict | list) -> Optional[dict]:
+    """Normalize a CheapShark game lookup response into a search-style game dict."""
     try:
-        async with httpx.AsyncClient() as client:
-            url = "https://www.cheapshark.com/api/1.0/games"
-            params = {"id": game_id}
-            response = await client.get(url, params=params, timeout=5.0)
-            response.raise_for_status()
-            data = response.json()
+        if isinstance(data, dict):
+            if game_id in data:
+                return data[game_id]
             
-            if isinstance(data, dict):
-                if game_id in data:
-                    return data[game_id]
+            if "info" in data:
+                info = data.get("info", {})
+                deals = data.get("deals", [])
+                cheapest_price_ever = data.get("cheapestPriceEver", {})
                 
-                if "info" in data:
-                    info = data.get("info", {})
-                    deals = data.get("deals", [])
-                    cheapest_price_ever = data.get("cheapestPriceEver", {})
-                    
-                    cheapest_price = 0.0
-                    cheapest_deal_id = ""
-                    if deals and len(deals) > 0:
-                        cheapest_deal = min(deals, key=lambda d: float(d.get("price", "999999")))
-                        cheapest_price = float(cheapest_deal.get("price", 0))
-                        cheapest_deal_id = cheapest_deal.get("dealID", "")
-                    elif cheapest_price_ever:
-                        cheapest_price = float(cheapest_price_ever.get("price", 0))
-                    
-                    return {
-                        "gameID": game_id,
-                        "external": info.get("title", "Unknown"),
-                        "thumb": info.get("thumb", ""),
-                        "cheapest": cheapest_price,
-                        "cheapestDealID": cheapest_deal_id,
-                    }
+                cheapest_price = 0.0
+                cheapest_deal_id = ""
+                cheapest_deal, best_price = find_cheapest_deal(deals)
+                if cheapest_deal is not None:
+                    cheapest_price = best_price
+                    cheapest_deal_id = cheapest_deal.get("dealID", "")
+                elif cheapest_price_ever:
+                    cheapest_price = float(cheapest_price_ever.get("price", 0))
                 
-                if "gameID" in data and str(data.get("gameID")) == game_id:
-                    return data
-                if "external" in data or "thumb" in data:
-                    return data
-            elif isinstance(data, list) and len(data) > 0:
-                for item in data:
-                    if isinstance(item, dict) and str(item.get("gameID", "")) == game_id:
-                        return item
-                if isinstance(data[0], dict) and ("external" in data[0] or "thumb" in data[0]):
-                    return data[0]
+                return {
+                    "gameID": game_id,
+                    "external": info.get("title", "Unknown"),
+                    "thumb": info.get("thumb", ""),
+                    "cheapest": cheapest_price,
+                    "cheapestDealID": cheapest_deal_id,
+                }
             
-            logger.warning(f"Unexpected response format for game lookup {game_id}: {type(data)}")
-            return None
-    except httpx.HTTPError as e:
-        logger.warning(f"HTTP error looking up game {game_id}: {e}")
-        return None
+            if "gameID" in data and str(data.get("gameID")) == game_id:
+                return data
+            if "external" in data or "thumb" in data:
+                return data
+        elif isinstance(data, list) and len(data) > 0:
+            for item in data:
+                if isinstance(item, dict) and str(item.get("gameID", "")) == game_id:
+                    return item
+            if isinstance(data[0], dict) and ("external" in data[0] or "thumb" in data[0]):
+                return data[0]
     except Exception as e:
-        logger.warning(f"Lookup error for game {game_id}: {type(e).__name__}: {e}")
+        logger.warning("Lookup error for game %s: %s: %s", game_id, type(e).__name__, e)
         return None
+    
+    logger.warning("Unexpected response format for game lookup %s: %s", game_id, type(data))
+    return None
 
 
 async def fetch_price_comparison_from_lookup(game_lookup_response: dict) -> list[dict]:
@@ -162,8 +256,8 @@ async def fetch_price_comparison_from_lookup(game_lookup_response: dict) -> list
                     }
         
         price_comparison = sorted(
-            list(store_prices.values()),
-            key=lambda x: x["price"]
+            store_prices.values(),
+            key=itemgetter("price")
         )
         
         logger.info(f"Found {len(price_comparison)} stores for price comparison")
@@ -173,108 +267,124 @@ async def fetch_price_comparison_from_lookup(game_lookup_response: dict) -> list
         return []
 
 
-async def fetch_price_comparison(game_id: str) -> list[dict]:
-    """Fetch all deals for a game from different stores to compare prices."""
-    try:
-        stores_map = await fetch_cheapshark_stores()
-        
-        async with httpx.AsyncClient() as client:
-            url = "https://www.cheapshark.com/api/1.0/deals"
-            params = {"pageSize": 200}
-            response = await client.get(url, params=params, timeout=10.0)
-            response.raise_for_status()
-            all_deals = response.json()
-            
-            game_deals = [
-                deal for deal in all_deals 
-                if str(deal.get("gameID", "")) == game_id
-            ]
-            
-            store_prices = {}
-            for deal in game_deals:
-                store_id_raw = deal.get("storeID")
-                sale_price = float(deal.get("salePrice", 0))
-                deal_id = deal.get("dealID", "")
-                
-                if sale_price >= 0 and store_id_raw is not None:
-                    store_id = str(store_id_raw)
-                    store_name = stores_map.get(store_id, f"Store {store_id}")
-                    
-                    if store_name.startswith("Store "):
-                        logger.warning(f"Store ID {store_id} not found in stores map. Available stores: {list(stores_map.keys())[:10]}...")
-                    
-                    deal_url = None
-                    if deal_id:
-                        deal_url = f"https://www.cheapshark.com/redirect?dealID={deal_id}"
-                    
-                    if store_name not in store_prices or sale_price < store_prices[store_name]["price"]:
-                        store_prices[store_name] = {
-                            "store": store_name,
-                            "price": sale_price,
-                            "url": deal_url
-                        }
-            
-            price_comparison = sorted(
-                list(store_prices.values()),
-                key=lambda x: x["price"]
-            )
-            
-            return price_comparison
-    except httpx.HTTPError as e:
-        logger.error(f"HTTP error fetching price comparison for game {game_id}: {e}")
-        return []
-    except Exception as e:
-        logger.error(f"Error fetching price comparison for game {game_id}: {e}")
-        return []
+async def fetch_rawg_game_info(title: str, detail: bool = True) -> Optional[dict]:
+    """Fetch game info from RAWG API (cached for an hour).
+    
+    With ``detail=False`` only the search hit is fetched, which already carries
+    ``background_image``; the detail call is needed for description and genres.
+    """
+    rawg_info, _ = await _lookup_rawg_game_info(title, detail)
+    return rawg_info or None
 
 
-async def fetch_rawg_game_info(title: str) -> Optional[dict]:
-    """Fetch game info from RAWG API for description and genres."""
+async def _lookup_rawg_game_info(title: str, detail: bool) -> tuple[Optional[dict], bool]:
+    """Cached RAWG lookup returning the info and whether it is complete (see _request_rawg_game_info)."""
     if not RAWG_API_KEY:
-        return None
+        return None, True
+    
+    # RAWG search ignores case and spacing, so titles differing only in those share entries
+    normalized_title = " ".join(title.lower().split())
     
+    # A cached detail response also satisfies a search-only lookup
+    rawg_info = _rawg_cache.get((normalized_title, True))
+    if rawg_info is None and not detail:
+        rawg_info = _rawg_cache.get((normalized_title, False))
+    if rawg_info is not None:
+        return rawg_info, True
+    
+    # Concurrent lookups of the same title share one request
+    key = (normalized_title, detail)
+    return await single_flight(_rawg_inflight, key, lambda: _fetch_and_cache_rawg_game_info(title, key))
+
+
+async def _fetch_and_cache_rawg_game_info(title: str, key: tuple[str, bool]) -> tuple[Optional[dict], bool]:
+    """Request RAWG info under the concurrency cap and cache hits and verified misses under ``key``."""
+    async with _RAWG_SEMAPHORE:
+        rawg_info, complete = await _request_rawg_game_info(title, detail=key[1])
+    if rawg_info is not None:
+        # A search hit standing in for details that couldn't be fetched only serves image lookups
+        _rawg_cache[key if complete else (key[0], False)] = rawg_info
+    return rawg_info, complete
+
+
+async def _request_rawg_game_info(title: str, detail: bool = True, budget: float = 2.0) -> tuple[Optional[dict], bool]:
+    """Search RAWG for a title and, if requested, fetch its details within one overall time budget.
+    
+    Returns the info and whether it is complete: {} when RAWG has no match, None when the
+    lookup failed, and the bare search hit (incomplete) when the details couldn't be fetched.
+    """
+    deadline = time.monotonic() + budget
     try:
-        async with httpx.AsyncClient() as client:
-            search_url = "https://api.rawg.io/api/games"
-            search_params = {"key": RAWG_API_KEY, "search": title, "page_size": 1}
-            search_response = await client.get(search_url, params=search_params, timeout=2.0)
-            search_response.raise_for_status()
-            search_data = search_response.json()
-            results = search_data.get("results", [])
-            
-            if not results:
-                return None
-            
-            game_data = results[0]
-            game_id = game_data.get("id")
-            
-            if game_id:
-                try:
-                    detail_url = f"https://api.rawg.io/api/games/{game_id}"
-                    detail_params = {"key": RAWG_API_KEY}
-                    detail_response = await client.get(detail_url, params=detail_params, timeout=2.0)
-                    detail_response.raise_for_status()
-                    return detail_response.json()
-                except (httpx.HTTPError, httpx.RequestError) as e:
-                    logger.warning(f"Failed to fetch RAWG game details for {title}: {e}")
-                    return game_data
-            
-            return game_data
-    except (httpx.HTTPError, httpx.RequestError) as e:
+        search_url = "https://api.rawg.io/api/games"
+        search_params = {"key": RAWG_API_KEY, "search": title, "page_size": 1}
+        search_response = await get_with_retry(search_url, params=search_params, retries=1, deadline=deadline)
+        if search_response.status_code >= 400:
+            logger.warning(f"RAWG search returned HTTP {search_response.status_code} for {title}")
+            return None, False
+        search_data = orjson.loads(search_response.content)
+        results = search_data.get("results", [])
+        
+        if not results:
+            return {}, True
+        
+        game_data = results[0]
+        game_id = game_data.get("id")
+        if not detail or not game_id:
+            return game_data, True
+        
+        if time.monotonic() < deadline:
+            try:
+                detail_url = f"https://api.rawg.io/api/games/{game_id}"
+                detail_params = {"key": RAWG_API_KEY}
+                detail_response = await get_with_retry(detail_url, params=detail_params, retries=0, deadline=deadline)
+                if detail_response.status_code < 400:
+                    return orjson.loads(detail_response.content), True
+                logger.warning(f"RAWG details returned HTTP {detail_response.status_code} for {title}")
+            except (httpx.HTTPError, orjson.JSONDecodeError) as e:
+                logger.warning(f"Failed to fetch RAWG game details for {title}: {e}")
+        
+        return game_data, False
+    except (httpx.HTTPError, orjson.JSONDecodeError) as e:
         logger.warning(f"Failed to fetch RAWG game info for {title}: {e}")
-    except Exception as e:
-        logger.error(f"Unexpected error fetching RAWG game info for {title}: {e}")
-    return None
+    return None, False
+
+
+async def fetch_rawg_batch(titles: list[str], detail: bool = True, timeout: Optional[float] = None) -> dict[str, dict]:
+    """Fetch RAWG info for many titles at once (deduplicated); titles RAWG doesn't know map to {}.
+    
+    Titles whose lookup failed or came back without the requested details are left out, so
+    callers can tell complete results from ones worth retrying. With a ``timeout``, titles
+    still loading when it expires are left out too; their lookups keep running in the
+    background and fill the cache for later calls.
+    """
+    unique_titles = list(dict.fromkeys(titles))
+    if not unique_titles:
+        return {}
+    
+    tasks = {title: asyncio.create_task(_lookup_rawg_game_info(title, detail)) for title in unique_titles}
+    try:
+        await asyncio.wait(tasks.values(), timeout=timeout)
+    finally:
+        # Only the waiters are cancelled; the shielded lookups behind them carry on
+        for task in tasks.values():
+            task.cancel()
+    
+    rawg_map = {}
+    for title, task in tasks.items():
+        if not task.done() or task.cancelled() or task.exception() is not None:
+            continue
+        rawg_info, complete = task.result()
+        if complete:
+            rawg_map[title] = rawg_info or {}
+    return rawg_map
 
 
 async def fetch_rawg_image_only(title: str) -> Optional[str]:
-    """Fetch only the image URL from RAWG API with timeout."""
+    """Fetch only the image URL from RAWG API (search hit only, no detail call)."""
     try:
-        rawg_info = await asyncio.wait_for(fetch_rawg_game_info(title), timeout=2.0)
+        rawg_info = await fetch_rawg_game_info(title, detail=False)
         if rawg_info:
             return rawg_info.get("background_image")
-    except asyncio.TimeoutError:
-        logger.warning(f"Timeout fetching RAWG image for {title}")
     except Exception as e:
         logger.warning(f"Error fetching RAWG image for {title}: {e}")
     return None
@@ -292,8 +402,23 @@ def calculate_discount(savings_str: str, normal_price: float, sale_price: float)
         return ((normal_price - sale_price) / normal_price * 100) if normal_price > 0 else 0
 
 
-async def transform_deal_to_game_response(deal: dict, is_trending: bool = False, is_deal_of_day: bool = False, fetch_rawg: bool = False, fetch_rawg_image: bool = False, price_comparison: Optional[list[dict]] = None) -> GameResponse:
-    """Transform CheapShark deal to GameResponse format."""
+def transform_search_result_to_deal(game: dict, game_id: Optional[str] = None) -> dict:
+    """Map a CheapShark search/lookup entry onto the deals-feed shape used by transform_deal_to_game_response."""
+    cheapest = float(game.get("cheapest", 0))
+    return {
+        "gameID": game_id if game_id is not None else game.get("gameID", ""),
+        "title": game.get("external", "Unknown"),
+        "thumb": game.get("thumb", ""),
+        "salePrice": cheapest,
+        # Search results carry no list price; assume a 20% discount off an estimated original
+        "normalPrice": cheapest / 0.8 if cheapest > 0 else 0,
+        "savings": "100.0" if cheapest == 0 else "20.0",
+        "dealID": game.get("cheapestDealID", ""),
+    }
+
+
+async def transform_deal_to_game_response(deal: dict, is_trending: bool = False, is_deal_of_day: bool = False, fetch_rawg: bool = False, fetch_rawg_image: bool = False, price_comparison: Optional[list[dict]] = None, rawg_info: Optional[dict] = None) -> GameResponse:
+    """Transform CheapShark deal to GameResponse format (pass prefetched ``rawg_info`` to skip the RAWG call)."""
     game_id = f"cs_{deal.get('gameID', '')}"
     title = deal.get("title", "Unknown")
     thumb = deal.get("thumb", "")
@@ -303,12 +428,14 @@ async def transform_deal_to_game_response(deal: dict, is_trending: bool = False,
     savings_str = deal.get("savings", "0")
     discount = calculate_discount(savings_str, normal_price, sale_price)
     
-    description = f"Experience {title} - Available now at great prices!"
-    genres = ["Action"]
+    description = None
+    genres = _DEFAULT_GENRES
     image = thumb
     
     if fetch_rawg or fetch_rawg_image:
-        rawg_info = await fetch_rawg_game_info(title)
+        if rawg_info is None:
+            # Image-only cards don't need the detail call's description/genres
+            rawg_info = await fetch_rawg_game_info(title, detail=fetch_rawg)
         if rawg_info:
             rawg_image = rawg_info.get("background_image")
             if rawg_image and (fetch_rawg or fetch_rawg_image):
@@ -324,26 +451,25 @@ async def transform_deal_to_game_response(deal: dict, is_trending: bool = False,
                 )
                 
                 if rawg_description and rawg_description.strip():
-                    clean_description = re.sub(r'<[^>]+>', '', str(rawg_description))
-                    clean_description = clean_description.replace('&nbsp;', ' ').replace('&amp;', '&')
-                    clean_description = clean_description.replace('&lt;', '<').replace('&gt;', '>')
-                    clean_description = clean_description.replace('&quot;', '"').replace('&#39;', "'")
+                    # Only the first 1000 chars are kept; 4x slack covers markup stripped below
+                    clean_description = _HTML_TAG_RE.sub('', str(rawg_description)[:4000])
+                    clean_description = html.unescape(clean_description).replace('\xa0', ' ')
                     
                     if clean_description.strip():
                         description = clean_description[:1000]
                 
                 genres_list = rawg_info.get("genres", [])
-                genres = [g.get("name", "") for g in genres_list if g.get("name")] or ["Action"]
+                genres = [g.get("name", "") for g in genres_list if g.get("name")] or _DEFAULT_GENRES
     
     price_comparison_list = None
     if price_comparison is not None and len(price_comparison) > 0:
-        from app.models.games import PriceComparison
-        price_comparison_list = [PriceComparison(**pc) for pc in price_comparison]
+        price_comparison_list = [PriceComparison.model_construct(**pc) for pc in price_comparison]
     
-    return GameResponse(
+    # Fields are built and typed here, so skip re-validating them
+    return GameResponse.model_construct(
         id=game_id,
         title=title,
-        description=description,
+        description=description or f"Experience {title} - Available now at great prices!",
         image=image,
         originalPrice=normal_price,
         currentPrice=sale_price,
@@ -7,7 +7,7 @@ from app.models.users import User
 
 def create_purchase(engine: Engine, user_id: int, purchase_data: PurchaseCreate) -> Purchase:
     """Create a new purchase record for a user"""
-    with Session(engine) as session:
+    with Session(engine, autoflush=False, expire_on_commit=False) as session:
         # Verify user exists
         user = session.get(User, user_id)
         if not user:
@@ -24,12 +24,9 @@ def create_purchase(engine: Engine, user_id: int, purchase_data: PurchaseCreate)
             store=purchase_data.store
         )
         
-        session.add(new_purchase)
-        session.commit()
-        session.refresh(new_purchase)
-        
-        # Update user's purchase count
+        # Update user's purchase count in the same transaction
         user.purchase += 1
+        session.add(new_purchase)
         session.add(user)
         session.commit()
         
@@ -18,20 +18,20 @@ def create_review(*, engine: Engine, review_data: ReviewBase) -> None:
 
 def select_reviews(*, engine: Engine) -> list[GameReview]:
     with Session(engine) as session:
-        statement = select(Review, User).join(User,isouter=True)
+        statement = select(Review, User).join(User, Review.user_id == User.id, isouter=True)
         results = session.exec(statement)
         return [
                 GameReview(review=review, user=user)
-                for review, user in list(results)
+                for review, user in results
             ]
 
 def get_game_reviews(*, engine: Engine, game: str) -> list[GameReview]:
     with Session(engine) as session:
-        statement = select(Review, User).join(User,isouter=True).where(Review.game == game)
+        statement = select(Review, User).join(User, Review.user_id == User.id, isouter=True).where(Review.game == game)
         results = session.exec(statement)
         return [
                 GameReview(review=review, user=user)
-                for review, user in list(results)
+                for review, user in results
             ]
 
 
@@ -44,9 +44,7 @@ def delete_review(*, engine: Engine, review_id: int) -> None:
 
 def get_review(*, engine: Engine, review_id: int) -> Review | None:
     with Session(engine) as session:
-        statement = select(Review).where(Review.id == review_id)
-        results = session.exec(statement)
-        return results.first()
+        return session.get(Review, review_id)
 
 def get_user_reviews(*, engine: Engine, user_id: int) -> list[Review]:
     """Get all reviews written by a specific user."""
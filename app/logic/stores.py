@@ -1,77 +1,144 @@
 """Store management logic for CheapShark API."""
+import asyncio
 import httpx
+import orjson
 import logging
+import time
+from types import MappingProxyType
+from typing import Optional
 
 logger = logging.getLogger(__name__)
 
-# Cache for store names (store_id -> store_name)
+# Cache for store names (store_id -> store_name), refreshed from the API once a day
+_STORE_CACHE_TTL = 24 * 60 * 60
+# After a failed fetch, serve the fallback names for a minute before retrying
+_STORE_CACHE_RETRY = 60
 _store_cache: dict[str, str] = {}
-_store_cache_fetched: bool = False
+_store_cache_expiry: float = 0.0
+# Conditional-request headers (If-None-Match / If-Modified-Since) from the last fetched store list
+_store_cache_validators: dict[str, str] = {}
+# Single-flight: concurrent cold/expired callers wait for one /stores request
+_store_cache_lock = asyncio.Lock()
+# Background refresh started by warm_cheapshark_stores (held so it isn't garbage collected)
+_store_warm_up: Optional[asyncio.Task] = None
+
+# Well-known store names, used when the API fails and to fill gaps in its response
+FALLBACK_STORES = MappingProxyType({
+    "1": "Steam",
+    "2": "GamersGate",
+    "3": "GreenManGaming",
+    "7": "GOG",
+    "8": "Origin",
+    "11": "Humble Store",
+    "13": "Uplay",
+    "25": "Epic Games",
+})
 
 
 async def fetch_cheapshark_stores(force_refresh: bool = False) -> dict[str, str]:
-    """Fetch store names from CheapShark API and cache them."""
-    global _store_cache, _store_cache_fetched
-    
-    # Return cached data if available and not forcing refresh
-    if _store_cache and not force_refresh and _store_cache_fetched:
+    """Fetch store names from CheapShark API and cache them for a day."""
+    # Return cached data if still fresh and not forcing refresh
+    if _store_cache and not force_refresh and time.monotonic() < _store_cache_expiry:
         return _store_cache
     
+    async with _store_cache_lock:
+        # Another request may have refreshed the cache while we waited
+        if _store_cache and not force_refresh and time.monotonic() < _store_cache_expiry:
+            return _store_cache
+        return await _refresh_store_cache(force_refresh)
+
+
+def warm_cheapshark_stores() -> None:
+    """Start refreshing stale store names in the background without waiting for them.
+    
+    Callers that need the names still await fetch_cheapshark_stores(), which joins the
+    refresh through the cache lock. A failed refresh is logged, never raised.
+    """
+    global _store_warm_up
+    if _store_cache and time.monotonic() < _store_cache_expiry:
+        return
+    if _store_warm_up is not None and not _store_warm_up.done():
+        return
+    _store_warm_up = asyncio.create_task(fetch_cheapshark_stores())
+    _store_warm_up.add_done_callback(_log_failed_warm_up)
+
+
+def _log_failed_warm_up(task: asyncio.Task) -> None:
+    if not task.cancelled() and task.exception() is not None:
+        logger.error(f"Background store refresh failed: {task.exception()}")
+
+
+async def _refresh_store_cache(force_refresh: bool) -> dict[str, str]:
+    """Fetch the store list and rebuild the cache, falling back to known stores on failure."""
+    global _store_cache_expiry
+    
     # Clear cache if forcing refresh
     if force_refresh:
         _store_cache.clear()
-        _store_cache_fetched = False
+        _store_cache_validators.clear()
+        _store_cache_expiry = 0.0
+    
+    # Lazy import to avoid circular dependency (app.logic.games imports this module)
+    from app.logic.games import cheapshark_get
     
     try:
-        async with httpx.AsyncClient() as client:
-            url = "https://www.cheapshark.com/api/1.0/stores"
-            response = await client.get(url, timeout=10.0)
-            response.raise_for_status()
-            stores_data = response.json()
-            
-            if not isinstance(stores_data, list):
-                logger.warning(f"Expected list but got {type(stores_data)}")
-                stores_data = []
-            
-            # Build mapping: storeID -> storeName
-            for store in stores_data:
-                if not isinstance(store, dict):
-                    continue
-                    
-                # Try different possible field names
-                store_id_raw = store.get("storeID") or store.get("store_id") or store.get("id")
-                store_name = store.get("storeName") or store.get("store_name") or store.get("name") or ""
+        url = "https://www.cheapshark.com/api/1.0/stores"
+        response = await cheapshark_get(url, params=None, headers=_store_cache_validators, timeout=10.0)
+        if response.status_code == 304 and _store_cache:
+            # Unchanged since the last fetch: keep the cached names without re-downloading
+            _store_cache_expiry = time.monotonic() + _STORE_CACHE_TTL
+            return _store_cache
+        if response.status_code >= 400:
+            logger.error(f"CheapShark stores returned HTTP {response.status_code}")
+            stores_data = []
+        else:
+            stores_data = orjson.loads(response.content)
+        
+        if not isinstance(stores_data, list):
+            logger.warning(f"Expected list but got {type(stores_data)}")
+            stores_data = []
+        
+        # Build mapping: storeID -> storeName
+        fetched_stores: dict[str, str] = {}
+        for store in stores_data:
+            if not isinstance(store, dict):
+                continue
                 
-                # Convert store ID to string, handling both int and str
-                if store_id_raw is not None:
-                    store_id = str(store_id_raw)
-                    if store_id and store_name:
-                        _store_cache[store_id] = store_name
+            # Try different possible field names
+            store_id_raw = store.get("storeID") or store.get("store_id") or store.get("id")
+            store_name = store.get("storeName") or store.get("store_name") or store.get("name") or ""
             
-            if _store_cache:
-                _store_cache_fetched = True
-                logger.info(f"Successfully fetched {len(_store_cache)} stores from CheapShark")
-                return _store_cache
-            else:
-                logger.warning("No stores were parsed from CheapShark API response")
+            # Convert store ID to string, handling both int and str
+            if store_id_raw is not None:
+                store_id = str(store_id_raw)
+                if store_id and store_name:
+                    fetched_stores[store_id] = store_name
+        
+        if fetched_stores:
+            # Swap in place so callers holding the dict see the refreshed names;
+            # fallback names go in first so the API's names win
+            _store_cache.clear()
+            _store_cache.update(FALLBACK_STORES)
+            _store_cache.update(fetched_stores)
+            _store_cache_validators.clear()
+            if etag := response.headers.get("ETag"):
+                _store_cache_validators["If-None-Match"] = etag
+            if last_modified := response.headers.get("Last-Modified"):
+                _store_cache_validators["If-Modified-Since"] = last_modified
+            _store_cache_expiry = time.monotonic() + _STORE_CACHE_TTL
+            logger.info(f"Successfully fetched {len(fetched_stores)} stores from CheapShark")
+            return _store_cache
+        else:
+            logger.warning("No stores were parsed from CheapShark API response")
             
     except httpx.HTTPError as e:
         logger.error(f"HTTP error fetching stores from CheapShark: {e}")
-    except Exception as e:
-        logger.error(f"Error fetching stores from CheapShark: {type(e).__name__}: {e}")
+    except orjson.JSONDecodeError as e:
+        logger.error(f"Invalid stores response from CheapShark: {e}")
     
     # Fallback mapping if API fails or returns no data
-    fallback_stores = {
-        "1": "Steam",
-        "2": "GamersGate",
-        "3": "GreenManGaming",
-        "7": "GOG",
-        "8": "Origin",
-        "11": "Humble Store",
-        "13": "Uplay",
-        "25": "Epic Games",
-    }
-    _store_cache.update(fallback_stores)
+    _store_cache.update(FALLBACK_STORES)
+    _store_cache_expiry = time.monotonic() + _STORE_CACHE_RETRY
     logger.info(f"Using fallback stores: {len(_store_cache)} stores available")
     return _store_cache
 
@@ -1,16 +1,28 @@
 from fastapi import HTTPException, status, Depends
 from fastapi.security import OAuth2PasswordRequestForm
 from pydantic import EmailStr
-from sqlalchemy import Engine
+from sqlalchemy import Engine, bindparam, or_
+from sqlalchemy.orm import load_only
 from sqlmodel import Session, select
 from typing import Sequence, Annotated, TYPE_CHECKING
 
-from app.models.users import User, UserBase, UserRegister, UserRole, UserStatus
+from app.models.users import User, UserBase, UserRegister, UserResponse, UserRole, UserStatus
 from app.utilities.passwords import get_password_hash
 
 if TYPE_CHECKING:
     from app.dependencies import ActiveEngine, get_current_user
 
+# Built once so login/auth lookups reuse SQLAlchemy's compiled statement cache entry
+_SELECT_USER_BY_EMAIL = select(User).where(User.email == bindparam("email"))
+# Registration only needs to know whether the email is taken: EXISTS returns one boolean
+_SELECT_EMAIL_TAKEN = select(select(User.id).where(User.email == bindparam("email")).exists())
+# The user listing only loads the columns UserResponse exposes (never the password hash)
+_SELECT_USERS = (
+    select(User)
+    .options(load_only(*(getattr(User, field) for field in UserResponse.model_fields)))
+    .order_by(User.id)
+)
+
 
 def require_admin(engine: "ActiveEngine", user: "User"):
     """
@@ -65,8 +77,7 @@ def require_admin(engine: "ActiveEngine", user: "User"):
 
 def update_user(*, engine: Engine, edit_user: UserBase, email: EmailStr):
     with Session(engine) as session:
-        statement = select(User).where(User.email == email)
-        user = session.exec(statement).one()
+        user = session.exec(_SELECT_USER_BY_EMAIL, params={"email": email}).one()
 
         user.email = email
         user.role = edit_user.role
@@ -78,8 +89,7 @@ def update_user(*, engine: Engine, edit_user: UserBase, email: EmailStr):
 
 def update_user_status(*, engine: Engine, disable: UserStatus, email: EmailStr):
     with Session(engine) as session:
-        statement = select(User).where(User.email == email)
-        user = session.exec(statement).one()
+        user = session.exec(_SELECT_USER_BY_EMAIL, params={"email": email}).one()
 
         user.status = disable
 
@@ -88,21 +98,19 @@ def update_user_status(*, engine: Engine, disable: UserStatus, email: EmailStr):
 
 def delete_user_by_email(engine: Engine, email: EmailStr):
     with Session(engine) as session:
-        statement = select(User).where(User.email == email)
-        user = session.exec(statement).first()
+        user = session.exec(_SELECT_USER_BY_EMAIL, params={"email": email}).first()
         session.delete(user)
         session.commit()
 
 
 def select_users(engine: Engine) -> Sequence[User]:
     with Session(engine) as session:
-        return session.exec(select(User).order_by(User.id)).all()
+        return session.exec(_SELECT_USERS).all()
 
 def select_user(engine: Engine,user:Annotated[OAuth2PasswordRequestForm, Depends()]) -> User | None:
     """Pull out the user from the database and verify password"""
     with Session(engine) as session:
-        statement = select(User).where(User.email == user.username)
-        return session.exec(statement).first()
+        return session.exec(_SELECT_USER_BY_EMAIL, params={"email": user.username}).first()
 
 
 def get_user_by_username(engine: Engine, name: str) -> User | None:
@@ -115,8 +123,7 @@ def get_user_by_username(engine: Engine, name: str) -> User | None:
 def get_user_by_email(engine: Engine, email: EmailStr) -> User | None:
     """Get user by email"""
     with Session(engine) as session:
-        statement = select(User).where(User.email == email)
-        return session.exec(statement).first()
+        return session.exec(_SELECT_USER_BY_EMAIL, params={"email": email}).first()
 
 
 def get_user_by_google_id(engine: Engine, google_id: str) -> User | None:
@@ -126,12 +133,21 @@ def get_user_by_google_id(engine: Engine, google_id: str) -> User | None:
         return session.exec(statement).first()
 
 
+def select_user_by_email_or_google_id(email: EmailStr, google_id: str):
+    """Statement matching a user by email or Google ID, preferring the email match"""
+    return (
+        select(User)
+        .where(or_(User.email == email, User.google_id == google_id))
+        .order_by((User.email == email).desc())
+        .limit(1)
+    )
+
+
 def create_user(engine: Engine, user_data: UserRegister) -> User:
     """Create a new user with hashed password"""
     with Session(engine) as session:
         # Check if email already exists
-        existing_user = get_user_by_email(engine, user_data.email)
-        if existing_user:
+        if session.exec(_SELECT_EMAIL_TAKEN, params={"email": user_data.email}).one():
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Email already registered"
@@ -155,23 +171,8 @@ def create_user(engine: Engine, user_data: UserRegister) -> User:
 
 
 def create_user_from_google(engine: Engine, email: EmailStr, name: str | None, google_id: str) -> User:
-    """Create a new user from Google OAuth data"""
+    """Create a new user from Google OAuth data; the caller has already ruled out an existing match"""
     with Session(engine) as session:
-        # Check if user already exists by email or google_id
-        existing_user = get_user_by_email(engine, email)
-        if existing_user:
-            # Update google_id if not set
-            if not existing_user.google_id:
-                existing_user.google_id = google_id
-                session.add(existing_user)
-                session.commit()
-                session.refresh(existing_user)
-            return existing_user
-
-        existing_google_user = get_user_by_google_id(engine, google_id)
-        if existing_google_user:
-            return existing_google_user
-
         # Create new user
         new_user = User(
             email=email,
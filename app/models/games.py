@@ -1,5 +1,5 @@
 from sqlmodel import SQLModel, Field
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from typing import Optional
 
 
@@ -28,12 +28,17 @@ class GameWithPrices(BaseModel):
 
 
 class PriceComparison(BaseModel):
+    model_config = ConfigDict(frozen=True, extra='forbid')
+    
     store: str
     price: float
     url: Optional[str] = None
 
 
 class GameResponse(BaseModel):
+    # Built with model_construct from already-coerced data and shared between cached responses
+    model_config = ConfigDict(frozen=True, extra='forbid')
+    
     id: str
     title: str
     description: str
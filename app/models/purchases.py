@@ -1,7 +1,7 @@
 import datetime
 from sqlmodel import SQLModel, Field, Relationship
 from typing import Optional
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class PurchaseBase(SQLModel):
@@ -24,6 +24,8 @@ class Purchase(PurchaseBase, table=True):
 
 class PurchaseResponse(BaseModel):
     """Purchase response model for API"""
+    model_config = ConfigDict(from_attributes=True)
+    
     id: int
     user_id: int
     game_id: str
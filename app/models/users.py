@@ -1,7 +1,7 @@
 import datetime
 from enum import  auto, StrEnum
 from sqlmodel import SQLModel, Field
-from pydantic import EmailStr, BaseModel
+from pydantic import EmailStr, BaseModel, ConfigDict
 from typing import Optional
 
 
@@ -43,6 +43,8 @@ class UserRegister(SQLModel):
 
 class UserResponse(BaseModel):
     """User response model without password"""
+    model_config = ConfigDict(from_attributes=True)
+    
     id: int
     email: EmailStr
     name: str
@@ -1,17 +1,36 @@
+import asyncio
+import functools
 from typing import Optional, Dict, Any
-from fastapi import APIRouter, status, Query, HTTPException
+import orjson
+from fastapi import APIRouter, status, Query, HTTPException, Request, Response
 
 from app.logic.etl import get_igdb_games_500, IGDB_LIMIT, run_etl_pipeline, UpstreamDataError
+from app.utilities.cache import async_ttl_cache, single_flight
+from app.utilities.etag import etag_response
 
 router = APIRouter(prefix="/games", tags=["Games"])
 
+# In-flight ETL runs keyed by search term, so concurrent triggers share one pipeline run
+_etl_runs: Dict[Optional[str], asyncio.Task] = {}
+
+
+@async_ttl_cache(maxsize=16, ttl=600)
+async def _encoded_igdb_games(limit: int) -> Optional[bytes]:
+    """Fetch and JSON-encode the IGDB games listing; None (never cached) when IGDB returned nothing."""
+    result = await get_igdb_games_500(limit=limit)
+    if not result["games"]:
+        return None
+    return orjson.dumps(result)
+
+
 # Final endpoint URL: GET /games/?limit=500
 
 
-@router.get("/", status_code=status.HTTP_200_OK)
+@router.get("/", status_code=status.HTTP_200_OK, response_model=Dict[str, Any])
 async def get_all_games(
+    request: Request,
     limit: int = Query(default=500, ge=1, le=500, description="Maximum number of games to return (1-500)")
-) -> Dict[str, Any]:
+) -> Response:
     """
     Get games from IGDB API with full details.
     
@@ -35,25 +54,29 @@ async def get_all_games(
             - image_url: str | None (normalized cover URL from IGDB)
             
     On IGDB failure, returns {"count": 0, "games": []} and logs warning.
+    Successful listings are served from an encoded cache for 10 minutes
+    with an ETag, so clients revalidating an unchanged listing get an empty 304.
     """
     # Clamp limit to valid range using IGDB_LIMIT
     limit = max(1, min(limit, IGDB_LIMIT))
     
     # Call IGDB-only function (no CheapShark logic)
-    return await get_igdb_games_500(limit=limit)
+    body = await _encoded_igdb_games(limit)
+    if body is None:
+        return Response(content=orjson.dumps({"count": 0, "games": []}), media_type="application/json")
+    return etag_response(request, body)
 
 
 @router.post("/etl", status_code=status.HTTP_200_OK)
 async def trigger_etl(
     search: Optional[str] = Query(None, description="Search term to filter games"),
-):
+) -> Dict[str, Any]:
     """
     Trigger ETL pipeline to fetch game data from external APIs.
     DEV mode: Authentication temporarily disabled for testing.
     """
     try:
-        result = await run_etl_pipeline(search=search)
-        return result
+        return await single_flight(_etl_runs, search, functools.partial(run_etl_pipeline, search=search))
     except UpstreamDataError as e:
         raise HTTPException(
             status_code=status.HTTP_502_BAD_GATEWAY,
@@ -1,3 +1,4 @@
+import asyncio
 import os
 from typing import Annotated
 from datetime import timedelta
@@ -9,17 +10,13 @@ from app.dependencies import ActiveEngine
 from app.logic.auth import (
     create_access_token,
     get_google_current_user,
+    handle_google_login,
 )
 from dotenv import load_dotenv
-from google.oauth2 import id_token
-from google.auth.transport import requests
 
-from sqlmodel import Session, select
-
-from app.logic.users import create_user_from_google, get_user_by_email, get_user_by_google_id, select_user, \
-    update_user_status
+from app.logic.users import select_user, update_user_status
 from app.models.token import Token, TokenRequest
-from app.models.users import User, UserStatus
+from app.models.users import User, UserResponse, UserStatus
 from app.utilities.passwords import verify_password
 
 router = APIRouter(
@@ -31,54 +28,22 @@ router = APIRouter(
 
 load_dotenv()
 
+# Defaults to the 30 minutes documented in the README, so an unset variable can't stop the app importing
+_ACCESS_TOKEN_EXPIRE = timedelta(minutes=float(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", "30")))
+
 
-@router.post("/google")
+@router.post("/google", response_model=UserResponse)
 async def google_auth(engine: ActiveEngine, data: TokenRequest):
     """Login or signup with Google authentication"""
-    id_info = id_token.verify_oauth2_token(
-        data.token,
-        requests.Request(),
-        os.environ["GOOGLE_CLIENT_ID"],
-    )
-
-    email = id_info["email"]
-    name = id_info.get("name")
-    google_id = id_info["sub"]
-
-    # Check if user exists by email or google_id
-    user = get_user_by_email(engine, email) or get_user_by_google_id(engine, google_id)
-
-    if user:
-        # Existing user - login flow
-        # Update google_id if not set
-        if not user.google_id:
-            with Session(engine) as session:
-                # Get fresh user instance in this session
-                statement = select(User).where(User.id == user.id)
-                db_user = session.exec(statement).first()
-                if db_user:
-                    db_user.google_id = google_id
-                    db_user.status = UserStatus.ACTIVE
-                    session.add(db_user)
-                    session.commit()
-                    session.refresh(db_user)
-                    user = db_user
-    else:
-        # New user - signup flow
-        user = create_user_from_google(engine, email, name, google_id)
-
-    if user.status == UserStatus.SUSPENDED:
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="User already suspended")
-
-    update_user_status(engine=engine, email=user.email, disable=UserStatus.ACTIVE)
+    return await handle_google_login(engine, data.token)
 
 
 @router.post("/token", response_model=Token)
 async def login(engine: ActiveEngine, form_data: Annotated[OAuth2PasswordRequestForm, Depends()]):
     """Login and get access token."""
-    user = select_user(engine, form_data)
+    user = await asyncio.to_thread(select_user, engine, form_data)
 
-    if not user or not verify_password(form_data.password, user.password):
+    if not user or not await asyncio.to_thread(verify_password, form_data.password, user.password):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect username or password",
@@ -87,11 +52,11 @@ async def login(engine: ActiveEngine, form_data: Annotated[OAuth2PasswordRequest
     if user.status == UserStatus.SUSPENDED:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="User already suspended")
 
-    update_user_status(engine=engine, email=user.email, disable=UserStatus.ACTIVE)
+    await asyncio.to_thread(update_user_status, engine=engine, email=user.email, disable=UserStatus.ACTIVE)
 
     access_token = create_access_token(
         data={"sub": user.email},
-        expires_delta=timedelta(minutes=float(os.environ["ACCESS_TOKEN_EXPIRE_MINUTES"]))
+        expires_delta=_ACCESS_TOKEN_EXPIRE
     )
 
     return Token(access_token=access_token, token_type="bearer")
@@ -99,15 +64,15 @@ async def login(engine: ActiveEngine, form_data: Annotated[OAuth2PasswordRequest
 
 @router.post("/google/me", response_model=User)
 async def get_google_user(engine: ActiveEngine, data: TokenRequest):
-    return get_google_current_user(engine, data)
+    return await asyncio.to_thread(get_google_current_user, engine, data)
 
 
 @router.post("/google/token", response_model=Token)
 async def google_exchange_token(engine: ActiveEngine, data: TokenRequest):
     """Exchange a valid Google ID token for our JWT. Used so Google users can call PUT /users/preferences."""
-    user = get_google_current_user(engine, data)
+    user = await asyncio.to_thread(get_google_current_user, engine, data)
     access_token = create_access_token(
         data={"sub": user.email},
-        expires_delta=timedelta(minutes=float(os.environ["ACCESS_TOKEN_EXPIRE_MINUTES"]))
+        expires_delta=_ACCESS_TOKEN_EXPIRE
     )
     return Token(access_token=access_token, token_type="bearer")
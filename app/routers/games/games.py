@@ -1,19 +1,22 @@
-from typing import Optional
-from fastapi import APIRouter, Depends, status, Query, HTTPException
+from typing import Optional, Any, Union
+from fastapi import APIRouter, status, Query, HTTPException
 import logging
-import httpx
-from app.dependencies import get_current_user
 from app.models.games import GameResponse
+from app.logic.stores import warm_cheapshark_stores
 from app.logic.games import (
     fetch_cheapshark_deals,
+    fetch_cheapshark_deals_by_game_id,
     fetch_cheapshark_games_search,
-    fetch_cheapshark_game_lookup,
-    fetch_price_comparison,
+    fetch_cheapshark_game_lookup_raw,
     fetch_price_comparison_from_lookup,
+    find_cheapest_deal,
+    fetch_rawg_batch,
+    parse_cheapshark_game_lookup,
     transform_deal_to_game_response,
+    transform_search_result_to_deal,
 )
-from app.logic.etl import run_etl_pipeline
 import asyncio
+from cachetools import TTLCache
 
 router = APIRouter(
     prefix="/games",
@@ -24,22 +27,104 @@ router = APIRouter(
 
 logger = logging.getLogger(__name__)
 
+# Finished single-game responses (lookup + price comparison + RAWG), keyed by game_id
+_GAME_CACHE: TTLCache = TTLCache(maxsize=2048, ttl=300)
 
-# ============== ENDPOINTS ==============
+# Listing responses keyed by endpoint, reused while the deals page they were built from
+# is still the cached one (so they expire with the 60s deals cache)
+_LISTING_CACHE: dict[str, tuple[list[dict], Any]] = {}
 
-@router.post("/etl", status_code=status.HTTP_200_OK)
-async def trigger_etl(
-    search: Optional[str] = Query(None, description="Search term to filter games"),
-    current_user: dict = Depends(get_current_user),
-):
-    """
-    Trigger ETL pipeline to fetch game data from external APIs.
-    Requires authentication.
+
+def _cached_listing(endpoint: str, deals: list[dict]) -> Optional[Any]:
+    """Return the response previously built for ``endpoint`` from this exact deals page."""
+    cached = _LISTING_CACHE.get(endpoint)
+    if cached is not None and cached[0] is deals:
+        return cached[1]
+    return None
+
+
+# Seconds /trending and /deal-of-the-day wait for uncached RAWG info before answering with
+# placeholder text (the lookups finish in the background and are used by the next request)
+_RAWG_LISTING_WAIT = 0.5
+
+# Deals pages scanned when the lookup can't resolve a game (CheapShark caps pageSize at 60)
+_FALLBACK_PAGES = 3
+
+
+async def _deal_from_pages_or_error(cheapshark_game_id: str) -> Union[Optional[dict], Exception]:
+    """Scan the first deals pages concurrently and return the first deal for the game.
+    
+    Failures are returned instead of raised so they can't tear down the caller's TaskGroup;
+    an error is only reported when no page could be read at all.
     """
-    result = await run_etl_pipeline(search=search)
-    return result
+    page_tasks = [
+        asyncio.create_task(fetch_cheapshark_deals_by_game_id(page_size=60, page_number=page))
+        for page in range(_FALLBACK_PAGES)
+    ]
+    errors: list[Exception] = []
+    try:
+        for next_page in asyncio.as_completed(page_tasks):
+            try:
+                deals_by_game_id = await next_page
+            except Exception as e:
+                errors.append(e)
+                continue
+            game_deals = deals_by_game_id.get(cheapshark_game_id)
+            if game_deals:
+                return game_deals[0]
+        return errors[-1] if len(errors) == len(page_tasks) else None
+    finally:
+        for task in page_tasks:
+            task.cancel()
 
 
+async def _match_from_lookup(cheapshark_game_id: str, lookup_data: Any) -> tuple[Optional[dict], Optional[dict], list]:
+    """Build a deal-shaped dict from a CheapShark lookup payload, plus its price comparison when available."""
+    matching_deal = None
+    game_lookup_response = None
+    price_comparison = []
+    
+    try:
+        if isinstance(lookup_data, dict):
+            if cheapshark_game_id in lookup_data:
+                game_lookup_response = lookup_data[cheapshark_game_id]
+            elif "info" in lookup_data:
+                game_lookup_response = lookup_data
+        
+        if game_lookup_response:
+            price_comparison = await fetch_price_comparison_from_lookup(game_lookup_response)
+            
+            info = game_lookup_response.get("info", {})
+            deals = game_lookup_response.get("deals", [])
+            cheapest_price = 0.0
+            cheapest_deal_id = ""
+            
+            if deals:
+                cheapest_deal, best_price = find_cheapest_deal(deals)
+                if cheapest_deal is not None:
+                    cheapest_price = best_price
+                    cheapest_deal_id = cheapest_deal.get("dealID", "")
+            
+            matching_deal = transform_search_result_to_deal({
+                "external": info.get("title", game_lookup_response.get("external", "Unknown")),
+                "thumb": info.get("thumb", game_lookup_response.get("thumb", "")),
+                "cheapest": cheapest_price,
+                "cheapestDealID": cheapest_deal_id,
+            }, game_id=cheapshark_game_id)
+    except Exception as e:
+        logger.warning(f"Error fetching game lookup for {cheapshark_game_id}: {e}")
+    
+    if not matching_deal and lookup_data is not None:
+        game_lookup = parse_cheapshark_game_lookup(cheapshark_game_id, lookup_data)
+        if game_lookup:
+            matching_deal = transform_search_result_to_deal(game_lookup, game_id=cheapshark_game_id)
+    
+    return matching_deal, game_lookup_response, price_comparison
+
+
+# ============== ENDPOINTS ==============
+
+# Shadowed by the admin IGDB GET /games/, which server.py registers first
 @router.get("/", response_model=list[GameResponse], status_code=status.HTTP_200_OK)
 async def get_all_games():
     """Fetch all games from external APIs."""
@@ -60,11 +145,19 @@ async def get_trending_games():
     """Fetch trending games (sorted by deal rating)."""
     try:
         deals = await fetch_cheapshark_deals(sort_by="Deal Rating", page_size=10)
-        # Process all games concurrently to avoid timeout issues
+        cached = _cached_listing("trending", deals)
+        if cached is not None:
+            return cached
+        
+        # One deduplicated RAWG batch for all titles, then transform concurrently
+        titles = [deal.get("title", "Unknown") for deal in deals]
+        rawg_map = await fetch_rawg_batch(titles, timeout=_RAWG_LISTING_WAIT)
 
         game_tasks = [
-            transform_deal_to_game_response(deal, is_trending=True, fetch_rawg=True)
-            for deal in deals
+            transform_deal_to_game_response(
+                deal, is_trending=True, fetch_rawg=True, rawg_info=rawg_map.get(title, {})
+            )
+            for deal, title in zip(deals, titles)
         ]
         games = await asyncio.gather(*game_tasks, return_exceptions=True)
         # Filter out any exceptions and convert to list
@@ -74,6 +167,9 @@ async def get_trending_games():
                 logger.warning(f"Error processing game: {game}")
                 continue
             valid_games.append(game)
+        # Placeholder entries aren't cached, so the next request picks up the finished lookups
+        if len(rawg_map) == len(set(titles)):
+            _LISTING_CACHE["trending"] = (deals, valid_games)
         return valid_games
     except Exception as e:
         logger.error(f"Error fetching trending games: {e}")
@@ -88,8 +184,18 @@ async def get_deal_of_the_day():
         if not deals:
             raise HTTPException(status_code=404, detail="No deals found")
         
+        cached = _cached_listing("deal-of-the-day", deals)
+        if cached is not None:
+            return cached
+        
         deal = deals[0]
-        game = await transform_deal_to_game_response(deal, is_deal_of_day=True, fetch_rawg=True)
+        title = deal.get("title", "Unknown")
+        rawg_map = await fetch_rawg_batch([title], timeout=_RAWG_LISTING_WAIT)
+        game = await transform_deal_to_game_response(
+            deal, is_deal_of_day=True, fetch_rawg=True, rawg_info=rawg_map.get(title, {})
+        )
+        if title in rawg_map:
+            _LISTING_CACHE["deal-of-the-day"] = (deals, game)
         return game
     except HTTPException:
         raise
@@ -108,23 +214,13 @@ async def search_games(q: str = Query(..., description="Search query")):
         games_data = await fetch_cheapshark_games_search(q.strip())
         games_data = games_data[:20]
         
-        games = []
-        for game_data in games_data:
-            cheapest = float(game_data.get("cheapest", 0))
-            estimated_original = cheapest / 0.8 if cheapest > 0 else 0
-            savings = "100.0" if cheapest == 0 else "20.0"
-            deal_like = {
-                "gameID": game_data.get("gameID", ""),
-                "title": game_data.get("external", "Unknown"),
-                "thumb": game_data.get("thumb", ""),
-                "salePrice": cheapest,
-                "normalPrice": estimated_original,
-                "savings": savings,
-            }
-            game = await transform_deal_to_game_response(deal_like, fetch_rawg=False, fetch_rawg_image=False)
-            games.append(game)
-        
-        return games
+        # gather preserves result order
+        return await asyncio.gather(*(
+            transform_deal_to_game_response(
+                transform_search_result_to_deal(game_data), fetch_rawg=False, fetch_rawg_image=False
+            )
+            for game_data in games_data
+        ))
     except Exception as e:
         logger.error(f"Error searching games: {e}")
         raise HTTPException(status_code=500, detail=f"Failed to search games: {str(e)}")
@@ -133,76 +229,37 @@ async def search_games(q: str = Query(..., description="Search query")):
 @router.get("/{game_id}", response_model=GameResponse, status_code=status.HTTP_200_OK)
 async def get_game_by_id(game_id: str):
     """Fetch a single game by ID."""
+    cached = _GAME_CACHE.get(game_id)
+    if cached is not None:
+        return cached
+    
     try:
         if game_id.startswith("cs_"):
             cheapshark_game_id = game_id.replace("cs_", "")
-            matching_deal = None
-            game_lookup_response = None
-            price_comparison = []
             
-            async with httpx.AsyncClient() as client:
-                url = "https://www.cheapshark.com/api/1.0/games"
-                params = {"id": cheapshark_game_id}
-                try:
-                    response = await client.get(url, params=params, timeout=5.0)
-                    response.raise_for_status()
-                    lookup_data = response.json()
-                    
-                    if isinstance(lookup_data, dict):
-                        if cheapshark_game_id in lookup_data:
-                            game_lookup_response = lookup_data[cheapshark_game_id]
-                        elif "info" in lookup_data:
-                            game_lookup_response = lookup_data
-                    
-                    if game_lookup_response:
-                        price_comparison = await fetch_price_comparison_from_lookup(game_lookup_response)
-                        
-                        info = game_lookup_response.get("info", {})
-                        deals = game_lookup_response.get("deals", [])
-                        cheapest_price = 0.0
-                        cheapest_deal_id = ""
-                        
-                        if deals and len(deals) > 0:
-                            cheapest_deal = min(deals, key=lambda d: float(d.get("price", "999999")))
-                            cheapest_price = float(cheapest_deal.get("price", 0))
-                            cheapest_deal_id = cheapest_deal.get("dealID", "")
-                        
-                        estimated_original = cheapest_price / 0.8 if cheapest_price > 0 else 0
-                        savings = "100.0" if cheapest_price == 0 else "20.0"
-                        matching_deal = {
-                            "gameID": cheapshark_game_id,
-                            "title": info.get("title", game_lookup_response.get("external", "Unknown")),
-                            "thumb": info.get("thumb", game_lookup_response.get("thumb", "")),
-                            "salePrice": cheapest_price,
-                            "normalPrice": estimated_original,
-                            "savings": savings,
-                            "dealID": cheapest_deal_id,
-                        }
-                except Exception as e:
-                    logger.warning(f"Error fetching game lookup for {cheapshark_game_id}: {e}")
+            # Start the store names the price comparison needs alongside the lookup
+            warm_cheapshark_stores()
             
-            if not matching_deal:
-                game_lookup = await fetch_cheapshark_game_lookup(cheapshark_game_id)
-                if game_lookup:
-                    cheapest = float(game_lookup.get("cheapest", 0))
-                    estimated_original = cheapest / 0.8 if cheapest > 0 else 0
-                    savings = "100.0" if cheapest == 0 else "20.0"
-                    matching_deal = {
-                        "gameID": cheapshark_game_id,
-                        "title": game_lookup.get("external", "Unknown"),
-                        "thumb": game_lookup.get("thumb", ""),
-                        "salePrice": cheapest,
-                        "normalPrice": estimated_original,
-                        "savings": savings,
-                        "dealID": game_lookup.get("cheapestDealID", ""),
-                    }
+            # Run the lookup and the deals-list fallback together so a miss costs max() not sum()
+            # of the two upstream calls; the TaskGroup cancels whatever is left on exit or error.
+            async with asyncio.TaskGroup() as tg:
+                lookup_task = tg.create_task(fetch_cheapshark_game_lookup_raw(cheapshark_game_id))
+                deals_task = tg.create_task(_deal_from_pages_or_error(cheapshark_game_id))
+                
+                # Single lookup call; both the detailed and the search-style parsing reuse its payload
+                lookup_data = await lookup_task
+                matching_deal, game_lookup_response, price_comparison = await _match_from_lookup(
+                    cheapshark_game_id, lookup_data
+                )
+                
+                if matching_deal:
+                    deals_task.cancel()
+                else:
+                    matching_deal = await deals_task
             
-            if not matching_deal:
-                deals = await fetch_cheapshark_deals(page_size=200)
-                for deal in deals:
-                    if str(deal.get("gameID", "")) == cheapshark_game_id:
-                        matching_deal = deal
-                        break
+            # Raised outside the TaskGroup, which would wrap it in an ExceptionGroup
+            if isinstance(matching_deal, Exception):
+                raise matching_deal
             
             if not matching_deal:
                 raise HTTPException(
@@ -210,10 +267,14 @@ async def get_game_by_id(game_id: str):
                     detail=f"Game with ID {game_id} not found. The game may no longer be available."
                 )
             
-            if not price_comparison:
-                price_comparison = await fetch_price_comparison(cheapshark_game_id)
-            
-            game = await transform_deal_to_game_response(matching_deal, fetch_rawg=True, price_comparison=price_comparison)
+            title = matching_deal.get("title", "Unknown")
+            rawg_map = await fetch_rawg_batch([title])
+            game = await transform_deal_to_game_response(
+                matching_deal, fetch_rawg=True, price_comparison=price_comparison, rawg_info=rawg_map.get(title, {})
+            )
+            # Placeholder RAWG text isn't cached, so the next request retries the details
+            if title in rawg_map:
+                _GAME_CACHE[game_id] = game
             return game
         else:
             raise HTTPException(status_code=404, detail=f"Invalid game ID format: {game_id}")
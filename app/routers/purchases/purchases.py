@@ -1,5 +1,7 @@
+import asyncio
 from typing import Annotated
-from fastapi import APIRouter, Depends, status, HTTPException, Query
+from fastapi import APIRouter, Depends, status, HTTPException, Query, Response
+from pydantic import TypeAdapter
 from app.dependencies import ActiveEngine, get_current_user
 from app.logic.purchases import get_user_purchases, create_purchase
 from app.models.purchases import PurchaseResponse, PurchaseCreate
@@ -11,6 +13,8 @@ router = APIRouter(
     responses={status.HTTP_404_NOT_FOUND: {"description": "Not found"}},
 )
 
+_PURCHASE_LIST_ADAPTER = TypeAdapter(list[PurchaseResponse])
+
 
 @router.get("/me", response_model=list[PurchaseResponse], status_code=status.HTTP_200_OK)
 async def get_my_purchases(
@@ -19,21 +23,11 @@ async def get_my_purchases(
     limit: int = Query(default=10, ge=1, le=50, description="Maximum number of purchases to return")
 ):
     """Get the current user's last purchases"""
-    purchases = get_user_purchases(engine, current_user.id, limit=limit)
-    return [
-        PurchaseResponse(
-            id=purchase.id,
-            user_id=purchase.user_id,
-            game_id=purchase.game_id,
-            game_title=purchase.game_title,
-            game_image_url=purchase.game_image_url,
-            game_genre=purchase.game_genre,
-            purchase_date=purchase.purchase_date,
-            price=purchase.price,
-            store=purchase.store
-        )
-        for purchase in purchases
-    ]
+    purchases = await asyncio.to_thread(get_user_purchases, engine, current_user.id, limit=limit)
+    # Validate the rows once and encode straight to JSON, instead of building models here
+    # and having FastAPI validate them again for the response
+    items = _PURCHASE_LIST_ADAPTER.validate_python(purchases, from_attributes=True)
+    return Response(content=_PURCHASE_LIST_ADAPTER.dump_json(items), media_type="application/json")
 
 
 @router.post("/", response_model=PurchaseResponse, status_code=status.HTTP_201_CREATED)
@@ -44,7 +38,7 @@ async def create_user_purchase(
 ):
     """Create a new purchase for the current user"""
     try:
-        purchase = create_purchase(engine, current_user.id, purchase_data)
+        purchase = await asyncio.to_thread(create_purchase, engine, current_user.id, purchase_data)
         return PurchaseResponse(
             id=purchase.id,
             user_id=purchase.user_id,
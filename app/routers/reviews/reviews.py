@@ -1,10 +1,14 @@
-from fastapi import APIRouter, HTTPException
+import asyncio
+
+from fastapi import APIRouter, HTTPException, Request, Response
+from pydantic import TypeAdapter
 from starlette import status
 
 from app.dependencies import ActiveEngine
 from app.logic.reviews import create_review, select_reviews, get_game_reviews, delete_review, get_review, \
     get_user_reviews
 from app.models.reviews import Review, GameReview
+from app.utilities.etag import etag_response
 
 router = APIRouter(
     prefix="/reviews",
@@ -12,36 +16,43 @@ router = APIRouter(
     responses={status.HTTP_404_NOT_FOUND: {"description": "Not found"}},
 )
 
+# The logic layer already returns GameReview instances, so they are encoded directly
+# instead of being validated again by FastAPI
+_GAME_REVIEW_ADAPTER = TypeAdapter(list[GameReview])
+
 
 @router.post("/", status_code=status.HTTP_201_CREATED)
 async def add_review(engine: ActiveEngine, review_data: Review) -> None:
-    create_review(engine=engine, review_data=review_data)
+    await asyncio.to_thread(create_review, engine=engine, review_data=review_data)
 
 
 @router.get("/", status_code=status.HTTP_200_OK, response_model=list[GameReview])
 async def read_reviews(engine: ActiveEngine):
-    return select_reviews(engine=engine)
+    reviews = await asyncio.to_thread(select_reviews, engine=engine)
+    return Response(content=_GAME_REVIEW_ADAPTER.dump_json(reviews), media_type="application/json")
 
 
 @router.get("/{game}", status_code=status.HTTP_200_OK, response_model=list[GameReview])
-async def read_game_reviews(game: str, engine: ActiveEngine):
-    return get_game_reviews(game=game, engine=engine)
+async def read_game_reviews(game: str, engine: ActiveEngine, request: Request):
+    reviews = await asyncio.to_thread(get_game_reviews, game=game, engine=engine)
+    # Revalidated on every read so a new review shows up immediately; unchanged lists cost a 304
+    return etag_response(request, _GAME_REVIEW_ADAPTER.dump_json(reviews), cache_control="no-cache")
 
 
 @router.delete("/{id}", status_code=status.HTTP_204_NO_CONTENT)
 async def remove_review(engine: ActiveEngine, id: int) -> None:
-    review = get_review(engine=engine, review_id=id)
+    review = await asyncio.to_thread(get_review, engine=engine, review_id=id)
     if not review:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Review not found"
         )
-    delete_review(engine=engine, review_id=id)
+    await asyncio.to_thread(delete_review, engine=engine, review_id=id)
 
 
-@router.get("/user/{user_id}", status_code=status.HTTP_200_OK)
+@router.get("/user/{user_id}", status_code=status.HTTP_200_OK, response_model=list[Review])
 async def read_user_reviews(user_id: int, engine: ActiveEngine):
     """Get all reviews written by a specific user."""
-    return get_user_reviews(engine=engine, user_id=user_id)
+    return await asyncio.to_thread(get_user_reviews, engine=engine, user_id=user_id)
 
 
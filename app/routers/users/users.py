@@ -1,11 +1,10 @@
 import asyncio
-from typing import Annotated
+from typing import Annotated, Optional
 
 from fastapi import APIRouter, status, Path, HTTPException
 from fastapi.params import Depends
 from pydantic import EmailStr
-from sqlmodel import Session, select
-from starlette.websockets import WebSocket, WebSocketDisconnect
+from sqlmodel import Session
 
 from app.dependencies import ActiveEngine, get_current_active_user
 from app.logic.users import create_user, select_users, delete_user_by_email, update_user, update_user_status
@@ -21,50 +20,37 @@ router = APIRouter(
 @router.post('/register', response_model=UserResponse, status_code=status.HTTP_201_CREATED)
 async def register(engine: ActiveEngine, user_data: UserRegister) -> UserResponse:
     """Register a new user"""
-    new_user = create_user(engine, user_data)
-    return UserResponse(
-        id=new_user.id,
-        email=new_user.email,
-        name=new_user.name,
-        google_id=new_user.google_id,
-        role=new_user.role,
-        status=new_user.status,
-        purchase=new_user.purchase,
-        joined=new_user.joined,
-        favorite_genre=getattr(new_user, "favorite_genre", None),
-        preferred_store=getattr(new_user, "preferred_store", None),
-    )
+    new_user = await asyncio.to_thread(create_user, engine, user_data)
+    return UserResponse.model_validate(new_user)
 
 
-@router.get('/', status_code=status.HTTP_200_OK)
+@router.get('/', response_model=list[UserResponse], status_code=status.HTTP_200_OK)
 async def get_users(engine: ActiveEngine):
-    return select_users(engine)
+    return await asyncio.to_thread(select_users, engine)
 
 
 @router.delete('/{email}', status_code=status.HTTP_204_NO_CONTENT)
 async def delete_user(engine: ActiveEngine, email: EmailStr):
-    delete_user_by_email(engine, email)
+    await asyncio.to_thread(delete_user_by_email, engine, email)
 
 
 @router.put("/preferences", status_code=status.HTTP_200_OK)
-async def update_preferences(
+def update_preferences(
     engine: ActiveEngine,
     preferences_data: PreferencesUpdate,
     current_user: Annotated[User, Depends(get_current_active_user)]
-):
+) -> dict[str, Optional[str]]:
     """Update user's gaming preferences (favoriteGenre, preferredStore)."""
-    with Session(engine) as db_session:
-        statement = select(User).where(User.id == current_user.id)
-        user = db_session.exec(statement).first()
+    # Primary-key lookup; the in-memory values stay valid after commit, so no refresh is needed
+    with Session(engine, expire_on_commit=False) as db_session:
+        user = db_session.get(User, current_user.id)
         if not user:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
         if preferences_data.favoriteGenre is not None:
             user.favorite_genre = preferences_data.favoriteGenre
         if preferences_data.preferredStore is not None:
             user.preferred_store = preferences_data.preferredStore
-        db_session.add(user)
         db_session.commit()
-        db_session.refresh(user)
         return {
             "message": "Preferences updated successfully",
             "favoriteGenre": user.favorite_genre,
@@ -76,31 +62,22 @@ async def update_preferences(
 async def edit_user(engine: ActiveEngine, email: Annotated[EmailStr, Path()], user: UserBase):
     if user.email is not None and user.email != email:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Changing email is not allowed")
-    update_user(
+    await asyncio.to_thread(
+        update_user,
         engine=engine,
         edit_user=user,
         email=email
     )
 
-@router.get('/me', status_code=status.HTTP_200_OK)
+@router.get('/me', response_model=UserResponse, status_code=status.HTTP_200_OK)
 async def get_me(current_user: Annotated[User, Depends(get_current_active_user)]):
-    return UserResponse(
-        id=current_user.id,
-        email=current_user.email,
-        name=current_user.name,
-        google_id=current_user.google_id,
-        role=current_user.role,
-        status=current_user.status,
-        purchase=current_user.purchase,
-        joined=current_user.joined,
-        favorite_genre=getattr(current_user, "favorite_genre", None),
-        preferred_store=getattr(current_user, "preferred_store", None),
-    )
+    return UserResponse.model_validate(current_user)
 
 
 @router.put('/{email}/logout', status_code=status.HTTP_202_ACCEPTED)
 async def logout_user(engine: ActiveEngine, email: Annotated[EmailStr, Path()], disable: UserStatus):
-    update_user_status(
+    await asyncio.to_thread(
+        update_user_status,
         engine=engine,
         email=email,
         disable=disable
@@ -1,11 +1,13 @@
 from typing import Annotated
 
-from fastapi import APIRouter, Body, Depends, HTTPException, Response, status
+from fastapi import APIRouter, Body, Depends, HTTPException, Request, Response, status
+from pydantic import TypeAdapter
 from sqlmodel import Session, select
 
 from app.dependencies import ActiveEngine, get_current_user
 from app.models.users import User
 from app.models.wishlist import WishlistCreate, WishlistItem, WishlistRead
+from app.utilities.etag import etag_response
 
 router = APIRouter(
     prefix="/wishlist",
@@ -13,6 +15,8 @@ router = APIRouter(
     responses={status.HTTP_404_NOT_FOUND: {"description": "Not found"}},
 )
 
+_WISHLIST_ADAPTER = TypeAdapter(list[WishlistRead])
+
 
 @router.post(
     "",
@@ -23,7 +27,7 @@ router = APIRouter(
         201: {"description": "Created"},
     },
 )
-async def add_to_wishlist(
+def add_to_wishlist(
     user: Annotated[User, Depends(get_current_user)],
     engine: ActiveEngine,
     response: Response,
@@ -84,9 +88,10 @@ async def add_to_wishlist(
         }
     },
 )
-async def get_my_wishlist(
+def get_my_wishlist(
     user: Annotated[User, Depends(get_current_user)],
     engine: ActiveEngine,
+    request: Request,
 ):
     """Get the current user's wishlist items."""
     with Session(engine) as session:
@@ -95,14 +100,16 @@ async def get_my_wishlist(
             .where(WishlistItem.user_id == user.id)
             .order_by(WishlistItem.created_at.desc())
         ).all()
-        return list(items)
+        # Validate the rows once and encode straight to JSON, skipping FastAPI's second pass
+        wishlist = _WISHLIST_ADAPTER.validate_python(items, from_attributes=True)
+        return etag_response(request, _WISHLIST_ADAPTER.dump_json(wishlist), cache_control="private, no-cache")
 
 
 @router.delete(
     "/{game_id}",
     status_code=status.HTTP_204_NO_CONTENT,
 )
-async def remove_from_wishlist(
+def remove_from_wishlist(
     game_id: str,
     user: Annotated[User, Depends(get_current_user)],
     engine: ActiveEngine,
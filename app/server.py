@@ -1,3 +1,4 @@
+import os
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
@@ -12,13 +13,33 @@ from app.routers.admin.genres import router as admin_genres_router
 from app.routers.admin.topdeals import router as admin_topdeals_router
 from app.routers.games import games
 from app.routers import wishlist
+from app.services.http_client import close_http_client, get_http_client
+
+
+# One engine per process (create_engine doesn't connect until first use)
+# SQL logging formats every statement; opt in with SQL_ECHO=true when debugging
+engine = create_engine(
+    postgresql_url,
+    echo=os.getenv("SQL_ECHO", "false").lower() == "true",
+    # Sized for the threadpool that runs the blocking DB calls; pre-ping and recycle
+    # drop connections the server or a proxy closed while idle
+    pool_size=10,
+    max_overflow=20,
+    pool_pre_ping=True,
+    pool_recycle=3600,
+    pool_timeout=30,
+)
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    engine = create_engine(postgresql_url, echo=True)
-    create_db_and_tables(engine)
+    # Schema creation inspects every table; deployments with an existing schema can skip it
+    if os.getenv("INIT_DB", "true").lower() == "true":
+        create_db_and_tables(engine)
+    # Open the shared upstream client at startup rather than on the first request
+    get_http_client()
     yield {"engine": engine}
+    await close_http_client()
     engine.dispose()
 app = FastAPI(lifespan=lifespan)
 
@@ -31,19 +52,25 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    # Let browsers reuse preflight results for a day instead of an OPTIONS per request
+    max_age=86400,
 )
 
 
 
-app.include_router(users.router)
-app.include_router(auth.router)
-app.include_router(purchases.router)
-app.include_router(admin_games_router)  
-app.include_router(admin_genres_router)  
-app.include_router(admin_topdeals_router)  
-app.include_router(reviews.router)
-app.include_router(games.router)
-app.include_router(wishlist.router)
+# Inclusion order is route precedence (the admin IGDB GET /games/ is matched first)
+for router in (
+    users.router,
+    auth.router,
+    purchases.router,
+    admin_games_router,
+    admin_genres_router,
+    admin_topdeals_router,
+    reviews.router,
+    games.router,
+    wishlist.router,
+):
+    app.include_router(router)
 
 
 
@@ -0,0 +1,74 @@
+"""Shared outbound HTTP client for upstream game APIs (CheapShark, RAWG, IGDB)."""
+import asyncio
+import time
+from typing import Any, Optional
+
+import httpx
+
+# One pooled client per process so keep-alive connections (and HTTP/2 streams)
+# are reused across requests instead of re-doing TCP + TLS on every call.
+_client: Optional[httpx.AsyncClient] = None
+
+# Upstream throttling / transient failures worth another attempt
+_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Return the shared AsyncClient, creating it on first use."""
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            http2=True,
+            timeout=httpx.Timeout(5.0),
+            limits=httpx.Limits(max_keepalive_connections=64, max_connections=128),
+        )
+    return _client
+
+
+async def close_http_client() -> None:
+    """Close the shared client; called from the app lifespan on shutdown."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+
+async def get_with_retry(
+    url: str,
+    *,
+    params: Optional[dict[str, Any]] = None,
+    headers: Optional[dict[str, str]] = None,
+    timeout: Optional[float] = None,
+    retries: int = 2,
+    backoff: float = 0.25,
+    deadline: Optional[float] = None,
+) -> httpx.Response:
+    """GET through the shared client, retrying 429/5xx and failed connects with exponential backoff.
+
+    Timeouts are not retried, so a slow upstream costs one ``timeout`` rather than one per attempt.
+    A ``deadline`` (a ``time.monotonic()`` value) caps every attempt's timeout to the time left
+    and stops retrying once the next backoff would pass it.
+    The last response is returned as-is, so callers still decide via ``raise_for_status()``.
+    """
+    client = get_http_client()
+    attempt = 0
+    while True:
+        # Without a timeout or deadline the client's default applies (None would disable it)
+        attempt_timeout = httpx.USE_CLIENT_DEFAULT if timeout is None else timeout
+        if deadline is not None:
+            remaining = max(deadline - time.monotonic(), 0.0)
+            attempt_timeout = remaining if timeout is None else min(timeout, remaining)
+        error: Optional[httpx.ConnectError] = None
+        try:
+            response = await client.get(url, params=params, headers=headers, timeout=attempt_timeout)
+            if response.status_code not in _RETRY_STATUSES:
+                return response
+        except httpx.ConnectError as e:
+            error = e
+        delay = backoff * 2 ** attempt
+        if attempt >= retries or (deadline is not None and time.monotonic() + delay >= deadline):
+            if error is not None:
+                raise error
+            return response
+        await asyncio.sleep(delay)
+        attempt += 1
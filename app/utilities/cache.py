@@ -0,0 +1,68 @@
+import asyncio
+import functools
+from typing import Any, Awaitable, Callable, Hashable, Optional
+
+from cachetools import TTLCache
+from cachetools.keys import hashkey
+
+
+def single_flight(
+    inflight: dict,
+    key: Hashable,
+    start: Callable[[], Awaitable[Any]],
+    on_done: Optional[Callable[[asyncio.Task], None]] = None,
+) -> Awaitable[Any]:
+    """Join the in-flight call for ``key`` in ``inflight``, starting ``start()`` if there is none.
+
+    Concurrent callers with the same key share one call. Each caller awaits it through
+    ``asyncio.shield``, so one caller giving up (a timeout, a client disconnect) doesn't
+    cancel the call for the others; it always runs to completion. ``on_done(task)`` runs
+    once the call has finished and ``key`` has been released.
+    """
+    task = inflight.get(key)
+    if task is None:
+        task = asyncio.create_task(start())
+        inflight[key] = task
+
+        def _release(finished: asyncio.Task) -> None:
+            inflight.pop(key, None)
+            # Also marks the exception as retrieved when every caller has gone away
+            if not finished.cancelled():
+                finished.exception()
+            if on_done is not None:
+                on_done(finished)
+
+        task.add_done_callback(_release)
+    return asyncio.shield(task)
+
+
+def async_ttl_cache(maxsize: int, ttl: float):
+    """Memoize an async function's non-None results for ``ttl`` seconds.
+
+    Concurrent calls with the same arguments share one call (see ``single_flight``),
+    so a cold key costs a single upstream request. Exceptions and None are never cached.
+    """
+    def decorator(func):
+        cache: TTLCache = TTLCache(maxsize=maxsize, ttl=ttl)
+        inflight: dict[tuple, asyncio.Task] = {}
+
+        def _store(key: tuple, task: asyncio.Task) -> None:
+            if not task.cancelled() and task.exception() is None and task.result() is not None:
+                cache[key] = task.result()
+
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            key = hashkey(*args, **kwargs)
+            result = cache.get(key)
+            if result is not None:
+                return result
+            return await single_flight(
+                inflight,
+                key,
+                functools.partial(func, *args, **kwargs),
+                on_done=functools.partial(_store, key),
+            )
+
+        wrapper.cache = cache
+        return wrapper
+    return decorator
@@ -0,0 +1,13 @@
+import hashlib
+
+from fastapi import Request, Response
+
+
+def etag_response(request: Request, body: bytes, cache_control: str = "public, max-age=60") -> Response:
+    """Return ``body`` as JSON with a content-hash ETag, or an empty 304 if the client already has it."""
+    etag = f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+    headers = {"ETag": etag, "Cache-Control": cache_control}
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and etag in (tag.strip().removeprefix("W/") for tag in if_none_match.split(",")):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
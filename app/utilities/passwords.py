@@ -1,6 +1,17 @@
+import os
+
 from pwdlib import PasswordHash
+from pwdlib.hashers.argon2 import Argon2Hasher
 
-password_hash = PasswordHash.recommended()
+# Argon2 cost, tunable per deployment (defaults match PasswordHash.recommended()).
+# Existing hashes carry their own parameters, so changing these never breaks verification.
+password_hash = PasswordHash((
+    Argon2Hasher(
+        time_cost=int(os.getenv("ARGON2_TIME_COST", "3")),
+        memory_cost=int(os.getenv("ARGON2_MEMORY_COST", "65536")),
+        parallelism=int(os.getenv("ARGON2_PARALLELISM", "4")),
+    ),
+))
 
 
 def verify_password(plain_password: str, hashed_password: str):